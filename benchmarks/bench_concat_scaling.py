@@ -0,0 +1,93 @@
+import time
+import copy
+import pandas as pd
+
+from cebl_data.utils.extract_game_data import extract_pbp_data, extract_player_data
+from cebl_data.utils.helpers import concat_frames
+from synthetic_game import synthetic_games
+
+
+def accumulate_in_loop(frames):
+    """
+    Build a dataset the way the pipeline used to, concatenating inside the game loop.
+
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        The per-game DataFrames.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    df = pd.DataFrame()
+    for frame in frames:
+        df = pd.concat([df, frame], ignore_index=True)
+    return df
+
+
+def time_call(func, frames, repeat=3):
+    """
+    Time a dataset builder, keeping the best of `repeat` runs.
+
+    Parameters
+    ----------
+    func : callable
+        The builder to time.
+    frames : list of pd.DataFrame
+        The per-game DataFrames passed to the builder.
+    repeat : int
+        The number of runs.
+
+    Returns
+    -------
+    float
+        The fastest run in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(frames)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_concat_scaling(game_counts=(50, 100, 200, 400)):
+    """
+    Compare building the pbp and player datasets with a concat inside the game loop
+    against a single concat_frames call, as the number of games grows. The per-game
+    time of concat_frames stays flat while the loop grows with the number of games.
+
+    Parameters
+    ----------
+    game_counts : tuple of int
+        The numbers of games to build datasets from.
+
+    Returns
+    -------
+    pd.DataFrame
+        The timings for each dataset and number of games.
+    """
+    games = synthetic_games(max(game_counts))
+    extracted = {
+        'pbp': [extract_pbp_data(copy.deepcopy(game)) for game in games],
+        'players': [extract_player_data(copy.deepcopy(game)) for game in games],
+    }
+
+    results = []
+    for dataset, frames in extracted.items():
+        for count in game_counts:
+            loop_seconds = time_call(accumulate_in_loop, frames[:count])
+            batch_seconds = time_call(concat_frames, frames[:count])
+            results.append({
+                'dataset': dataset, 'games': count,
+                'rows': sum(len(frame) for frame in frames[:count]),
+                'loop_seconds': loop_seconds, 'batch_seconds': batch_seconds,
+                'loop_ms_per_game': 1000 * loop_seconds / count,
+                'batch_ms_per_game': 1000 * batch_seconds / count,
+            })
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    print(bench_concat_scaling().to_string(index=False))
@@ -0,0 +1,213 @@
+import time
+import json
+import platform
+import argparse
+import pandas as pd
+
+import sys
+import os
+
+from cebl_data.utils.extract_game_data import (
+    extract_player_data, extract_player_data_batch, extract_team_data, extract_team_data_batch,
+    extract_coach_data, extract_coach_data_batch, extract_officials_data, extract_officials_data_2019,
+    extract_officials_data_2019_batch, extract_pbp_data, extract_pbp_data_batch, extract_pbp_data_2019,
+    extract_pbp_data_2019_batch,
+)
+from cebl_data.utils.helpers import (
+    clean_player_data, clean_team_data, clean_coach_data, clean_officials_data, clean_pbp_data,
+    clean_schedule_data, concat_frames,
+)
+from synthetic_game import synthetic_games, synthetic_schedule
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'baselines', 'extract_clean.json')
+
+# A benchmark is slower than its baseline when its time grows by more than this fraction
+REGRESSION_TOLERANCE = 0.25
+
+# Every timed run lasts at least this long
+MIN_SECONDS = 0.2
+
+# Per-game extractors are called once per game, batch extractors once with every game
+EXTRACTORS = {
+    'extract_player_data': extract_player_data,
+    'extract_team_data': extract_team_data,
+    'extract_coach_data': extract_coach_data,
+    'extract_officials_data': extract_officials_data,
+    'extract_officials_data_2019': extract_officials_data_2019,
+    'extract_pbp_data': extract_pbp_data,
+    'extract_pbp_data_2019': extract_pbp_data_2019,
+}
+BATCH_EXTRACTORS = {
+    'extract_player_data_batch': extract_player_data_batch,
+    'extract_team_data_batch': extract_team_data_batch,
+    'extract_coach_data_batch': extract_coach_data_batch,
+    'extract_officials_data_2019_batch': extract_officials_data_2019_batch,
+    'extract_pbp_data_batch': extract_pbp_data_batch,
+    'extract_pbp_data_2019_batch': extract_pbp_data_2019_batch,
+}
+
+# Each cleaner and the extractor whose output it cleans
+CLEANERS = {
+    'clean_player_data': (clean_player_data, 'extract_player_data'),
+    'clean_team_data': (clean_team_data, 'extract_team_data'),
+    'clean_coach_data': (clean_coach_data, 'extract_coach_data'),
+    'clean_officials_data': (clean_officials_data, 'extract_officials_data'),
+    'clean_pbp_data': (clean_pbp_data, 'extract_pbp_data'),
+}
+
+
+def time_best(func, repeat, min_seconds=MIN_SECONDS):
+    """
+    Time a call, keeping the best of `repeat` runs. Each run calls the function as
+    many times as it takes to last at least min_seconds, so fast functions are not
+    dominated by timer noise.
+
+    Parameters
+    ----------
+    func : callable
+        Called without arguments.
+    repeat : int
+        The number of runs.
+    min_seconds : float
+        The shortest time a run may take.
+
+    Returns
+    -------
+    tuple of (float, object)
+        The fastest time of one call in seconds and the value returned by the last call.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            result = func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+        best = min(best, elapsed / calls)
+    return best, result
+
+
+def bench_extract_clean(game_count=100, repeat=3):
+    """
+    Time every extractor and clean_* helper on synthetic games.
+
+    Parameters
+    ----------
+    game_count : int
+        The number of synthetic games.
+    repeat : int
+        The number of runs of each benchmark; the fastest is kept.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per benchmark with its seconds, rows, games/sec and rows/sec.
+    """
+    games = synthetic_games(game_count)
+    results = []
+    extracted = {}
+
+    def record(name, seconds, rows):
+        results.append({
+            'benchmark': name, 'games': game_count, 'rows': rows, 'seconds': seconds,
+            'games_per_sec': game_count / seconds, 'rows_per_sec': rows / seconds,
+        })
+
+    for name, extract in EXTRACTORS.items():
+        seconds, frames = time_best(lambda: [extract(game) for game in games], repeat)
+        extracted[name] = concat_frames(frames)
+        record(name, seconds, len(extracted[name]))
+
+    for name, extract in BATCH_EXTRACTORS.items():
+        seconds, frame = time_best(lambda: extract(games), repeat)
+        record(name, seconds, len(frame))
+
+    raw_schedule = synthetic_schedule(games)
+    seconds, schedule = time_best(lambda: clean_schedule_data(raw_schedule), repeat)
+    record('clean_schedule_data', seconds, len(schedule))
+    for name, (clean, extractor) in CLEANERS.items():
+        seconds, frame = time_best(lambda: clean(extracted[extractor]), repeat)
+        record(name, seconds, len(frame))
+
+    return pd.DataFrame(results)
+
+
+def save_baseline(results, file_name=BASELINE_FILE):
+    """
+    Save benchmark results as the baseline later runs are compared to. Timings only
+    compare on the same machine, so the machine and library versions are saved too.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        Returned by bench_extract_clean.
+    file_name : str
+        The baseline file to write.
+    """
+    baseline = {
+        'machine': platform.platform(), 'processor': platform.processor(),
+        'python': platform.python_version(), 'pandas': pd.__version__,
+        'benchmarks': {row['benchmark']: row for row in results.to_dict('records')},
+    }
+    os.makedirs(os.path.dirname(file_name), exist_ok=True)
+    with open(file_name, 'w') as f:
+        json.dump(baseline, f, indent=1)
+
+
+def compare_to_baseline(results, file_name=BASELINE_FILE, tolerance=REGRESSION_TOLERANCE):
+    """
+    Compare benchmark results to a saved baseline.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        Returned by bench_extract_clean.
+    file_name : str
+        The baseline file.
+    tolerance : float
+        How much slower than its baseline, as a fraction, a benchmark may get before
+        it counts as a regression.
+
+    Returns
+    -------
+    pd.DataFrame
+        The results with the baseline rows/sec, the change in rows/sec and whether the
+        benchmark regressed. Benchmarks without a baseline are never regressions.
+    """
+    with open(file_name) as f:
+        baseline = json.load(f)['benchmarks']
+    comparison = results.copy()
+    comparison['baseline_rows_per_sec'] = comparison['benchmark'].map(
+        lambda name: baseline[name]['rows_per_sec'] if name in baseline else float('nan'))
+    comparison['change'] = comparison['rows_per_sec'] / comparison['baseline_rows_per_sec'] - 1
+    # Throughput is compared rather than seconds, so runs with a different --games compare too
+    comparison['regressed'] = comparison['rows_per_sec'] * (1 + tolerance) < comparison['baseline_rows_per_sec']
+    return comparison
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the extractors and cleaners on synthetic games.')
+    parser.add_argument('--games', type=int, default=100, help='number of synthetic games')
+    parser.add_argument('--repeat', type=int, default=3, help='runs of each benchmark, the fastest is kept')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='the baseline file')
+    parser.add_argument('--save-baseline', action='store_true', help='save the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help='fraction a benchmark may slow down before it counts as a regression')
+    args = parser.parse_args()
+
+    results = bench_extract_clean(args.games, args.repeat)
+    if args.save_baseline or not os.path.exists(args.baseline):
+        print(results.to_string(index=False))
+        save_baseline(results, args.baseline)
+        print(f'Saved baseline to {args.baseline}')
+    else:
+        comparison = compare_to_baseline(results, args.baseline, args.tolerance)
+        print(comparison.to_string(index=False))
+        regressed = comparison.loc[comparison['regressed'], 'benchmark'].tolist()
+        if regressed:
+            print(f"Slower than the baseline: {', '.join(regressed)}")
+            sys.exit(1)
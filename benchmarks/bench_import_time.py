@@ -0,0 +1,98 @@
+import json
+import argparse
+import subprocess
+import pandas as pd
+
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# The seconds each entry module may take to import in a fresh interpreter, and the
+# modules it must not load: janitor and PyGithub are only imported once they are used,
+# and the cebl-data command and the step runners import no pipeline until a step runs.
+IMPORT_BUDGETS = {
+    'cebl_data.cli': (0.1, ['pandas']),
+    'cebl_data.update.update_data': (0.1, ['pandas']),
+    'cebl_data.update.update_schedule_data': (1.5, ['janitor', 'github']),
+    'cebl_data.update.update_game_data': (1.5, ['janitor', 'github']),
+    'cebl_data.update.compact_game_data': (1.5, ['janitor', 'github']),
+    'cebl_data.initial.initialize_data': (1.5, ['janitor', 'github']),
+    'cebl_data.initial.initialize_game_data': (1.5, ['janitor', 'github']),
+}
+
+# Imports a module in a fresh interpreter and prints the seconds it took and which of
+# the modules given are loaded afterwards
+_IMPORT_SCRIPT = """
+import sys, json, time, importlib
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+importlib.import_module({module!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': [name for name in {forbidden!r} if name in sys.modules]}}))
+"""
+
+
+def time_import(module, forbidden=()):
+    """
+    Time the import of a module of this checkout in a fresh interpreter.
+
+    Parameters
+    ----------
+    module : str
+        The module to import.
+    forbidden : list of str
+        Modules to check for after the import.
+
+    Returns
+    -------
+    tuple of (float, list of str)
+        The seconds the import took and the forbidden modules it loaded.
+    """
+    script = _IMPORT_SCRIPT.format(root=ROOT, module=module, forbidden=list(forbidden))
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result['seconds'], result['loaded']
+
+
+def bench_import_time(repeat=5, budgets=IMPORT_BUDGETS):
+    """
+    Time the import of every entry module against its budget.
+
+    Parameters
+    ----------
+    repeat : int
+        Imports of each module, the fastest is kept.
+    budgets : dict
+        The budget seconds and forbidden modules of each module, like IMPORT_BUDGETS.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per module with its import seconds, its budget, the forbidden modules
+        it loaded and whether it is over budget.
+    """
+    results = []
+    for module, (budget, forbidden) in budgets.items():
+        runs = [time_import(module, forbidden) for _ in range(repeat)]
+        seconds = min(seconds for seconds, _ in runs)
+        loaded = sorted(set().union(*(loaded for _, loaded in runs)))
+        results.append({
+            'module': module, 'seconds': seconds, 'budget': budget, 'loaded': ', '.join(loaded),
+            'over_budget': seconds > budget or bool(loaded),
+        })
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the imports of the entry modules against their budgets.')
+    parser.add_argument('--repeat', type=int, default=5, help='imports of each module, the fastest is kept')
+    args = parser.parse_args()
+
+    results = bench_import_time(args.repeat)
+    print(results.to_string(index=False))
+    over_budget = results.loc[results['over_budget'], 'module'].tolist()
+    if over_budget:
+        print(f"Over the import budget: {', '.join(over_budget)}")
+        sys.exit(1)
@@ -0,0 +1,368 @@
+import re
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import importlib
+import tempfile
+import threading
+import tracemalloc
+import multiprocessing
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pandas as pd
+import requests
+
+import os
+
+from synthetic_game import synthetic_game, synthetic_schedule, as_2019_format
+
+
+# Roughly the number of games in a CEBL season today; scale multiplies it
+GAMES_PER_SEASON = 110
+
+# The first season of the pipelines, which run every season up to the current year
+FIRST_SEASON = 2019
+
+# The pipeline modules that take the seasons to run from the current year
+CURRENT_YEAR_MODULES = [
+    'cebl_data.initial.intialize_schedule_data', 'cebl_data.update.update_schedule_data',
+    'cebl_data.update.update_game_data', 'cebl_data.update.compact_game_data', 'cebl_data.utils.game_cache',
+]
+
+# Number of distinct synthetic games the mock server cycles through
+TEMPLATE_GAMES = 16
+
+# The real hosts the pipelines request, and the path each is served under by the mock server
+CEBL_API_URL = 'https://api.data.cebl.ca/'
+FIBA_URL = 'https://fibalivestats.dcd.shared.geniussports.com/'
+RELEASES_URL = 'https://github.com/ryanndu/cebl-data/releases/download/'
+MOCK_PATHS = {CEBL_API_URL: 'cebl/', FIBA_URL: 'fiba/', RELEASES_URL: 'releases/'}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """
+    Serves the CEBL schedule API, the FIBA game JSON and the release assets from
+    the state of its MockServer, and counts every request and response byte.
+    """
+
+    def do_GET(self):
+        server = self.server
+        if self.path == '/_stats':
+            with server.lock:
+                return self._send(200, json.dumps(server.stats).encode(), count=False)
+
+        match = re.fullmatch(r'/cebl/games/(\d+)/', self.path)
+        if match:
+            return self._send(200, json.dumps(server.schedule_records(int(match.group(1)))).encode())
+
+        match = re.fullmatch(r'/fiba/data/(\d+)/data\.json', self.path)
+        if match:
+            # Game ids start with their season, and 2019 games are served in the 2019 format
+            templates = server.templates_2019 if match.group(1).startswith('2019') else server.templates
+            template = int(match.group(1)) % len(templates)
+            etag = f'"{match.group(1)[:4]}-{template}"'
+            if self.headers.get('If-None-Match') == etag:
+                return self._send(304, b'')
+            return self._send(200, templates[template], {'ETag': etag})
+
+        match = re.fullmatch(r'/releases/([^/]+)/([^/]+)', self.path)
+        if match:
+            path = os.path.join(server.assets_dir, match.group(1), match.group(2))
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return self._send(200, f.read())
+        self._send(404, b'')
+
+    def _send(self, status, body, headers=None, count=True):
+        if count:
+            with self.server.lock:
+                self.server.stats['requests'] += 1
+                self.server.stats['bytes'] += len(body)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    A local stand-in for api.data.cebl.ca, fibalivestats and the release asset
+    downloads. Every season has games_per_season completed games, each served as one
+    of a few synthetic games (in the 2019 JSON format for 2019 games), and release
+    assets are read from assets_dir.
+    """
+    daemon_threads = True
+
+    def __init__(self, games_per_season, assets_dir):
+        super().__init__(('127.0.0.1', 0), MockHandler)
+        self.games_per_season = games_per_season
+        self.assets_dir = assets_dir
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'bytes': 0}
+        games = [synthetic_game(seed=index) for index in range(TEMPLATE_GAMES)]
+        for game in games:
+            del game['game_id'], game['season']
+        self.templates = [json.dumps(game).encode() for game in games]
+        self.templates_2019 = [json.dumps(as_2019_format(game)).encode() for game in games]
+        self.template_teams = [game['tm'] for game in games]
+
+    def schedule_records(self, year):
+        games = [
+            {'game_id': f'{year}{index:05d}', 'season': year, 'tm': self.template_teams[index % TEMPLATE_GAMES]}
+            for index in range(self.games_per_season)
+        ]
+        schedule = synthetic_schedule(games).drop(columns=['season', 'fiba_id', 'fiba_json_url'])
+        return schedule.to_dict('records')
+
+
+def _serve(games_per_season, assets_dir, ports):
+    server = MockServer(games_per_season, assets_dir)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_mock_server(games_per_season, assets_dir):
+    """
+    Start the mock server in its own process, so its work is not timed or traced
+    with the pipelines.
+
+    Parameters
+    ----------
+    games_per_season : int
+        The number of games in every season.
+    assets_dir : str
+        The directory release assets are served from, one subdirectory per tag.
+
+    Returns
+    -------
+    tuple of (multiprocessing.Process, str)
+        The server process and its base URL.
+    """
+    ports = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(games_per_season, assets_dir, ports), daemon=True)
+    process.start()
+    return process, f'http://127.0.0.1:{ports.get(timeout=60)}/'
+
+
+def route_to_mock_server(base_url):
+    """
+    Send every request made through requests to the mock server instead of the real
+    hosts in MOCK_PATHS.
+
+    Parameters
+    ----------
+    base_url : str
+        The base URL of the mock server.
+
+    Returns
+    -------
+    callable
+        Restores the real hosts when called.
+    """
+    original_request = requests.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        for real_url, mock_path in MOCK_PATHS.items():
+            if url.startswith(real_url):
+                url = base_url + mock_path + url[len(real_url):]
+                break
+        return original_request(self, method, url, *args, **kwargs)
+
+    requests.Session.request = request
+    return lambda: setattr(requests.Session, 'request', original_request)
+
+
+class MockAsset:
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            self._rawData = {'digest': 'sha256:' + hashlib.sha256(f.read()).hexdigest()}
+
+    def delete_asset(self):
+        os.remove(self.path)
+
+
+class MockRelease:
+    """
+    Stands in for a GitHub release: uploaded assets are copied to the assets
+    directory the mock server serves them from.
+    """
+    uploaded_bytes = 0
+
+    def __init__(self, assets_dir, tag):
+        self.tag_dir = os.path.join(assets_dir, tag)
+        os.makedirs(self.tag_dir, exist_ok=True)
+
+    def get_assets(self):
+        return [MockAsset(os.path.join(self.tag_dir, name)) for name in sorted(os.listdir(self.tag_dir))]
+
+    def upload_asset(self, path):
+        MockRelease.uploaded_bytes += os.path.getsize(path)
+        asset_path = os.path.join(self.tag_dir, os.path.basename(path))
+        shutil.copy(path, asset_path)
+        return MockAsset(asset_path)
+
+
+def shift_current_year(years):
+    """
+    Make the pipelines see a current year that is years later, so they run that many
+    more seasons. The mock server serves a schedule for any season.
+
+    Parameters
+    ----------
+    years : int
+        The years added to the current year.
+
+    Returns
+    -------
+    callable
+        Restores the real current year when called.
+    """
+    class ShiftedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            now = datetime.now(tz)
+            return now.replace(year=now.year + years, day=min(now.day, 28))
+
+    modules = [importlib.import_module(module) for module in CURRENT_YEAR_MODULES]
+    for module in modules:
+        module.datetime = ShiftedDatetime
+    return lambda: [setattr(module, 'datetime', datetime) for module in modules]
+
+
+def pipeline_stages():
+    """
+    The stages of the full backfill and of the daily update, run in this order. The
+    update runs twice, the second time like an off-day with no new games.
+
+    Returns
+    -------
+    list of tuple of (str, str, callable)
+        The pipeline, stage name and entry point of each stage.
+    """
+    from cebl_data.initial.initialize_data import INITIALIZE_STEPS
+    from cebl_data.update.update_schedule_data import update_schedule_data
+    from cebl_data.update.update_game_data import update_game_data
+    from cebl_data.update.compact_game_data import compact_game_data
+
+    stages = [
+        ('initialize_data', step, getattr(importlib.import_module(module), function))
+        for step, module, function in INITIALIZE_STEPS
+    ]
+    return stages + [
+        ('update_data', 'schedule', update_schedule_data),
+        ('update_data', 'game_data', update_game_data),
+        ('update_data_no_new_games', 'schedule', update_schedule_data),
+        ('update_data_no_new_games', 'game_data', update_game_data),
+        ('compact_game_data', 'compact', compact_game_data),
+    ]
+
+
+def run_scale(scale, games_per_season=GAMES_PER_SEASON, trace_memory=True, season_scale=1):
+    """
+    Run the full backfill, the daily update and compaction against a mock server
+    with scale times the games of a season and season_scale times the seasons, in a
+    fresh working directory.
+
+    Parameters
+    ----------
+    scale : int
+        The multiple of games_per_season served for every season.
+    games_per_season : int
+        The number of games in a season at scale 1.
+    trace_memory : bool
+        Whether to record the tracemalloc peak of each stage. Tracing slows the
+        pipelines down, and memory of BACKFILL_WORKERS processes is not included.
+    season_scale : int
+        The multiple of the seasons from FIRST_SEASON to the current year. The extra
+        seasons are synthetic seasons after the current year.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per stage with its games per season, seasons, wall time, requests, bytes downloaded, bytes
+        uploaded and peak traced memory.
+    """
+    from cebl_data.utils import upload_to_releases, release_assets
+
+    work_dir = tempfile.mkdtemp(prefix=f'cebl_scale_{scale}_')
+    assets_dir = os.path.join(work_dir, 'assets')
+    os.makedirs(assets_dir)
+    process, base_url = start_mock_server(scale * games_per_season, assets_dir)
+    restore_hosts = route_to_mock_server(base_url)
+    original_get_release = upload_to_releases.get_release
+    upload_to_releases.get_release = lambda tag: MockRelease(assets_dir, tag)
+    seasons = len(range(FIRST_SEASON, datetime.now().year + 1))
+    restore_year = shift_current_year((season_scale - 1) * seasons)
+    release_assets.reset_release_assets()
+    upload_to_releases._RELEASES.clear()
+    upload_to_releases._RELEASE_ASSETS.clear()
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+
+    results = []
+    try:
+        for pipeline, stage, run in pipeline_stages():
+            before = requests.get(base_url + '_stats').json()
+            uploaded = MockRelease.uploaded_bytes
+            if trace_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+            tracemalloc.stop()
+            after = requests.get(base_url + '_stats').json()
+            results.append({
+                'scale': scale, 'games_per_season': scale * games_per_season,
+                'season_scale': season_scale, 'seasons': season_scale * seasons, 'pipeline': pipeline, 'stage': stage, 'seconds': seconds,
+                'requests': after['requests'] - before['requests'],
+                'downloaded_mb': (after['bytes'] - before['bytes']) / 1e6,
+                'uploaded_mb': (MockRelease.uploaded_bytes - uploaded) / 1e6,
+                'peak_mb': peak / 1e6 if peak is not None else None,
+            })
+    finally:
+        os.chdir(cwd)
+        upload_to_releases.get_release = original_get_release
+        restore_year()
+        restore_hosts()
+        process.terminate()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the pipelines against a local mock server at several scales.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10], help='multiples of the games in a season')
+    parser.add_argument('--season-scales', type=int, nargs='+', default=[1],
+                        help='multiples of the seasons, run with every multiple of the games')
+    parser.add_argument('--games-per-season', type=int, default=GAMES_PER_SEASON, help='games in a season at scale 1')
+    parser.add_argument('--requests-per-second', default='1000',
+                        help='FIBA_REQUESTS_PER_SECOND for the run, the production limit throttles the mock server')
+    parser.add_argument('--no-memory', action='store_true', help='do not trace memory, for faster and truer timings')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    # Read by ingest_game_data when it is imported
+    os.environ['FIBA_REQUESTS_PER_SECOND'] = args.requests_per_second
+
+    seasons = len(range(FIRST_SEASON, datetime.now().year + 1))
+    results = []
+    for season_scale in args.season_scales:
+        for scale in args.scales:
+            print(f'Scale {scale}, season scale {season_scale}: '
+                  f'{season_scale * seasons} seasons of {scale * args.games_per_season} games')
+            results.append(run_scale(scale, args.games_per_season, not args.no_memory, season_scale))
+            print(results[-1].to_string(index=False))
+    results = pd.concat(results, ignore_index=True)
+    if args.output:
+        results.to_json(args.output, orient='records', indent=1)
@@ -0,0 +1,245 @@
+import random
+import pandas as pd
+
+
+FIRST_NAMES = ['James', 'Marcus', 'Tre', 'Jean-Victor', 'Kalif', 'Mitch', 'Jordan', 'Chris', 'Aaron', 'Koby']
+LAST_NAMES = ['Smith', 'Young', 'Mukama', 'Wright', 'Van Dam', 'Jones', 'Brown', "O'Neil", 'Tchoumba', 'Lee']
+
+PLAYER_STATS = [
+    'FieldGoalsMade', 'FieldGoalsAttempted', 'FieldGoalsPercentage', 'ThreePointersMade',
+    'ThreePointersAttempted', 'ThreePointersPercentage', 'TwoPointersMade', 'TwoPointersAttempted',
+    'TwoPointersPercentage', 'FreeThrowsMade', 'FreeThrowsAttempted', 'FreeThrowsPercentage',
+    'ReboundsDefensive', 'ReboundsOffensive', 'ReboundsTotal', 'Assists', 'Turnovers', 'Steals',
+    'Blocks', 'BlocksReceived', 'FoulsPersonal', 'FoulsOn', 'Points', 'PointsSecondChance',
+    'PointsFastBreak', 'PlusMinusPoints', 'PointsInThePaint',
+]
+TEAM_STATS = PLAYER_STATS + [
+    'FoulsTotal', 'BenchPoints', 'PointsFromTurnovers', 'FoulsTeam', 'TurnoversTeam', 'ReboundsTeam',
+    'ReboundsTeamDefensive', 'ReboundsTeamOffensive', 'BiggestLead', 'BiggestScoringRun', 'LeadChanges',
+    'TimesScoresLevel',
+]
+QUALIFIERS = [[], ['fromturnover'], ['2ndchance', 'pointsinthepaint'], ['fastbreak', 'pointsinthepaint', 'fromturnover']]
+
+
+def _person(rng, **extra):
+    """
+    Build the name fields FIBA uses for players, coaches and officials.
+
+    Parameters
+    ----------
+    rng : random.Random
+        The random generator.
+    **extra
+        Additional fields to add to the record.
+
+    Returns
+    -------
+    dict
+    """
+    first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    record = {
+        'firstName': first_name, 'familyName': last_name,
+        'internationalFirstName': first_name, 'internationalFamilyName': last_name,
+        'firstNameInitial': first_name[0], 'familyNameInitial': last_name[0],
+        'internationalFirstNameInitial': first_name[0], 'internationalFamilyNameInitial': last_name[0],
+        'scoreboardName': first_name[0] + '. ' + last_name,
+    }
+    record.update(extra)
+    return record
+
+
+def _synthetic_player(rng, number):
+    player = _person(
+        rng, sMinutes=f'{rng.randint(0, 40)}:{rng.randint(0, 59):02d}', playingPosition=rng.choice(['G', 'F', 'C']),
+        shirtNumber=str(number), captain=rng.choice([1, None]) if number == 0 else None, active=1,
+        starter=int(number < 5), photoT='https://example.com/t.png', photoS='https://example.com/s.png',
+    )
+    for stat in PLAYER_STATS:
+        player['s' + stat] = rng.randint(0, 10)
+    for index in range(1, 8):
+        player[f'eff_{index}'] = rng.random() * 20
+    return player
+
+
+def _synthetic_team(rng, team_num, players_per_team):
+    team = {
+        'name': 'Team ' + team_num, 'shortName': 'T' + team_num, 'code': 'TM' + team_num,
+        'score': rng.randint(70, 110), 'tot_sMinutes': '200:00', 'fouls': rng.randint(0, 5),
+        'timeouts': rng.randint(0, 3), 'coach': 'Head Coach', 'assistcoach1': 'Assistant One',
+        'assistcoach2': 'Assistant Two', 'nameInternational': 'Team ' + team_num,
+        'shortNameInternational': 'T' + team_num, 'codeInternational': 'TM' + team_num, 'logo': 'logo',
+        'logoT': {'url': 'https://example.com/t.png', 'size': 'T', 'height': 100, 'width': 100, 'bytes': 1000},
+        'logoS': {'url': 'https://example.com/s.png', 'size': 'S', 'height': 50, 'width': 50, 'bytes': 500},
+        'p1_score': rng.randint(10, 30), 'p2_score': rng.randint(10, 30), 'p3_score': rng.randint(10, 30),
+        'p4_score': rng.randint(10, 30), 'tot_sTimeLeading': rng.random() * 40,
+        'pl': {str(number + 1): _synthetic_player(rng, number) for number in range(players_per_team)},
+        'shot': [],
+        'coachDetails': _person(rng),
+        'assistcoach1Details': _person(rng),
+        'assistcoach2Details': _person(rng) if team_num == '1' else None,
+    }
+    for stat in TEAM_STATS:
+        team['tot_s' + stat] = rng.randint(0, 50)
+    for index in range(1, 8):
+        team[f'tot_eff_{index}'] = rng.random() * 100
+    return team
+
+
+def _synthetic_action(rng, action_number):
+    team_num = rng.choice([0, 1, 2])
+    if team_num:
+        action_type = rng.choice(['2pt', '3pt', 'freethrow', 'rebound', 'foul', 'substitution', 'turnover'])
+        player = _person(rng, player='P. Player', pno=rng.randint(1, 12), shirtNumber=str(rng.randint(0, 30)))
+    else:
+        action_type = rng.choice(['game', 'period', 'timeout'])
+        player = {key: '' for key in _person(rng)}
+        player.update(player='', pno=0, shirtNumber='')
+    action = {
+        'gt': f'{rng.randint(0, 9):02d}:{rng.randint(0, 59):02d}', 's1': str(rng.randint(0, 100)),
+        's2': str(rng.randint(0, 100)), 'lead': rng.randint(-20, 20), 'tno': team_num,
+        'period': rng.randint(1, 4), 'periodType': 'REGULAR', 'success': rng.randint(0, 1),
+        'actionType': action_type, 'actionNumber': action_number,
+        'previousAction': action_number - 1 if action_number > 1 else '',
+        'qualifier': rng.choice(QUALIFIERS), 'subType': rng.choice(['jumpshot', 'layup', 'drivinglayup', '']),
+        'scoring': rng.randint(0, 1),
+    }
+    action.update(player)
+    return action
+
+
+def synthetic_game(seed=0, game_id='1', season=2024, actions=450, players_per_team=12):
+    """
+    Generate a game JSON shaped like the FIBA live stats data.json, with the
+    'tm' (including 'pl', 'shot' and coach details), 'pbp' and 'officials'
+    structures, plus the flat officials keys of the 2019 format. The game is
+    already tagged with 'game_id' and 'season' like fetch_game_json does.
+
+    Parameters
+    ----------
+    seed : int
+        Seed for the random generator, so the same game is generated every time.
+    game_id : str
+        The fiba_id of the game.
+    season : int
+        The season year.
+    actions : int
+        The number of play-by-play actions.
+    players_per_team : int
+        The number of players on each team.
+
+    Returns
+    -------
+    dict
+        The synthetic game JSON.
+    """
+    rng = random.Random(seed)
+    tm = {team_num: _synthetic_team(rng, team_num, players_per_team) for team_num in ['1', '2']}
+
+    # FIBA lists actions newest first, and each team's shots oldest first
+    pbp = [_synthetic_action(rng, action_number) for action_number in range(actions, 0, -1)]
+    for action in reversed(pbp):
+        if action['actionType'] in ('2pt', '3pt'):
+            tm[str(action['tno'])]['shot'].append({
+                'r': action['success'], 'x': rng.random() * 100, 'y': rng.random() * 100,
+                'actionType': action['actionType'], 'actionNumber': action['actionNumber'],
+                'period': action['period'], 'periodType': action['periodType'], 'pno': action['pno'],
+                'player': action['player'], 'subType': action['subType'],
+            })
+
+    officials = {
+        officials_type: _person(rng, name='Official ' + officials_type)
+        for officials_type in ['commissioner', 'referee1', 'referee2', 'referee3']
+    }
+    officials['referee3']['name'] = ''
+
+    return {
+        'tm': tm, 'pbp': pbp, 'officials': officials, 'game_id': game_id, 'season': season,
+        'officials_commisioner': ' Jane Smith ', 'officials_referee1': 'John Van Dam',
+        'officials_referee2': 'Chris Lee',
+    }
+
+
+def as_2019_format(game):
+    """
+    Convert a synthetic game to the 2019 JSON format, whose officials are only the flat
+    officials_* keys and whose shots have no action number.
+
+    Parameters
+    ----------
+    game : dict
+        A game returned by synthetic_game.
+
+    Returns
+    -------
+    dict
+        A converted copy of the game.
+    """
+    game = dict(game)
+    del game['officials']
+    game['tm'] = {
+        team_num: dict(team, shot=[{key: value for key, value in shot.items() if key != 'actionNumber'} for shot in team['shot']])
+        for team_num, team in game['tm'].items()
+    }
+    return game
+
+
+def synthetic_games(count, seasons=(2019, 2020, 2021, 2022, 2023, 2024), **kwargs):
+    """
+    Generate a list of synthetic games spread evenly over seasons.
+
+    Parameters
+    ----------
+    count : int
+        The number of games.
+    seasons : tuple of int
+        The seasons to spread the games over.
+    **kwargs
+        Passed to synthetic_game.
+
+    Returns
+    -------
+    list of dict
+    """
+    return [
+        synthetic_game(seed=i, game_id=str(2400000 + i), season=seasons[i % len(seasons)], **kwargs)
+        for i in range(count)
+    ]
+
+
+def synthetic_schedule(games, json_url='https://fibalivestats.dcd.shared.geniussports.com/data/{fiba_id}/data.json'):
+    """
+    Generate the raw schedule of synthetic games, shaped like the output of
+    extract_cebl_schedule.
+
+    Parameters
+    ----------
+    games : list of dict
+        Games returned by synthetic_games.
+    json_url : str
+        The FIBA JSON URL of each game, with a '{fiba_id}' placeholder.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    rows = []
+    for index, game in enumerate(games):
+        fiba_id = game['game_id']
+        home, away = game['tm']['1'], game['tm']['2']
+        stats_url = 'https://www.fibalivestats.com/u/CEBL/' + fiba_id + '/'
+        rows.append({
+            'id': str(100000 + index), 'start_time_utc': f"{game['season']}-06-01T23:00:00Z",
+            'status': 'COMPLETE', 'competition': 'Regular Season', 'venue_name': 'Arena ' + str(index % 10),
+            'period': '4', 'home_team_id': '1', 'home_team_name': home['name'], 'home_team_score': home['score'],
+            'home_team_logo_url': home['logoS']['url'], 'home_team_stats_url_en': stats_url + 'tm1.html',
+            'home_team_stats_url_fr': stats_url + 'tm1.html?lang=fr', 'away_team_id': '2',
+            'away_team_name': away['name'], 'away_team_score': away['score'],
+            'away_team_logo_url': away['logoS']['url'], 'away_team_stats_url_en': stats_url + 'tm2.html',
+            'away_team_stats_url_fr': stats_url + 'tm2.html?lang=fr', 'stats_url_en': stats_url + 'bs.html',
+            'stats_url_fr': stats_url + 'bs.html?lang=fr',
+            'cebl_stats_url_en': 'https://www.cebl.ca/game-stats?id=' + fiba_id,
+            'cebl_stats_url_fr': 'https://www.cebl.ca/fr/game-stats?id=' + fiba_id,
+            'tickets_url_en': 'https://example.com/tickets', 'tickets_url_fr': 'https://example.com/billets',
+            'season': game['season'], 'fiba_json_url': json_url.format(fiba_id=fiba_id), 'fiba_id': int(fiba_id),
+        })
+    return pd.DataFrame(rows)
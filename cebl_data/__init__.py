@@ -0,0 +1,2 @@
+# The pipelines are the cebl_data.utils, cebl_data.initial and cebl_data.update
+# modules, run through the cebl-data command (cebl_data.cli)
@@ -0,0 +1,5 @@
+from cebl_data.cli import main
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+import os
+import sys
+import runpy
+import argparse
+
+
+# The benchmarks are scripts of the checkout, next to the cebl_data package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# The scripts run by `cebl-data benchmark`, by name
+BENCHMARKS = {
+    'imports': 'bench_import_time.py',
+    'extract': 'bench_extract_clean.py',
+    'concat': 'bench_concat_scaling.py',
+    'scale': 'bench_pipeline_scale.py',
+}
+
+
+def _check_names(parser, kind, names, known_names):
+    unknown = [name for name in names or [] if name not in known_names]
+    if unknown:
+        parser.error(f"unknown {kind} {', '.join(unknown)}, choose from {', '.join(known_names)}")
+
+
+def run_update(args, parser):
+    """
+    Runs update_data, with only the steps given by --steps when set.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed arguments of the update command.
+    parser : argparse.ArgumentParser
+        The parser of the update command, to report unknown steps.
+    """
+    from cebl_data.update.update_data import UPDATE_STEPS, update_data
+
+    _check_names(parser, 'steps', args.steps, [step for step, _, _ in UPDATE_STEPS])
+    update_data(args.steps)
+
+
+def run_init(args, parser):
+    """
+    Runs initialize_data, with only the steps given by --steps when set.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed arguments of the init command.
+    parser : argparse.ArgumentParser
+        The parser of the init command, to report unknown steps.
+    """
+    from cebl_data.initial.initialize_data import INITIALIZE_STEPS, initialize_data
+
+    _check_names(parser, 'steps', args.steps, [step for step, _, _ in INITIALIZE_STEPS])
+    initialize_data(args.steps)
+
+
+def run_compact(args, parser):
+    """
+    Runs compact_game_data for the datasets and season given, and writes the run report.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed arguments of the compact command.
+    parser : argparse.ArgumentParser
+        The parser of the compact command, to report unknown datasets.
+    """
+    from cebl_data.utils.run_report import write_run_report
+    from cebl_data.utils.ingest_game_data import GAME_DATASETS
+    from cebl_data.update.compact_game_data import compact_game_data
+
+    _check_names(parser, 'datasets', args.datasets, list(GAME_DATASETS))
+    try:
+        compact_game_data(args.datasets, args.season)
+    finally:
+        write_run_report()
+
+
+def run_benchmark(args, parser):
+    """
+    Runs a benchmark script from the benchmarks directory of the checkout as if it was
+    run directly, passing on the remaining arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed arguments of the benchmark command.
+    parser : argparse.ArgumentParser
+        The parser of the benchmark command.
+    """
+    path = os.path.join(ROOT, 'benchmarks', BENCHMARKS[args.benchmark])
+    if not os.path.exists(path):
+        parser.error(f"the benchmarks are run from a cebl-data checkout, {path} does not exist")
+    sys.argv = [path] + args.args
+    sys.path.insert(0, os.path.dirname(path))
+    runpy.run_path(path, run_name='__main__')
+
+
+def build_parser():
+    """
+    Builds the parser of the cebl-data command. Nothing from the pipelines is imported
+    until a command runs, so only the modules of that command are loaded.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(prog='cebl-data', description='Build and publish the CEBL data releases.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update = commands.add_parser('update', help='publish the new games of the season')
+    update.add_argument('--steps', nargs='+', metavar='STEP',
+                        help='only run these steps of the update (schedule, game_data)')
+    update.set_defaults(run=run_update, parser=update)
+
+    init = commands.add_parser('init', help='rebuild every release from the first season')
+    init.add_argument('--steps', nargs='+', metavar='STEP',
+                      help='only run these steps of the rebuild (schedule, game_data)')
+    init.set_defaults(run=run_init, parser=init)
+
+    compact = commands.add_parser('compact', help='merge the delta partitions into the season files')
+    compact.add_argument('--datasets', nargs='+', metavar='DATASET', help='only compact these game datasets')
+    compact.add_argument('--season', type=int, help='only compact this season')
+    compact.set_defaults(run=run_compact, parser=compact)
+
+    benchmark = commands.add_parser('benchmark', help='run one of the benchmarks')
+    benchmark.add_argument('benchmark', choices=list(BENCHMARKS))
+    benchmark.add_argument('args', nargs=argparse.REMAINDER, help='arguments passed on to the benchmark')
+    benchmark.set_defaults(run=run_benchmark, parser=benchmark)
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point of the cebl-data command.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments, sys.argv[1:] by default.
+    """
+    args = build_parser().parse_args(argv)
+    args.run(args, args.parser)
+
+
+if __name__ == '__main__':
+    main()
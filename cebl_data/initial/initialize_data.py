@@ -0,0 +1,54 @@
+import importlib
+
+from cebl_data.utils.checkpoints import completed_steps, mark_step_completed, clear_checkpoints
+from cebl_data.utils.run_report import stage, write_run_report
+
+
+# Checkpoint scope of initialize_data
+INITIALIZE_CHECKPOINTS = 'initialize_data'
+
+# The steps of initialize_data, in order: the step name, and the module and function
+# that run it. Modules are only imported when their step runs.
+INITIALIZE_STEPS = [
+    ('schedule', 'cebl_data.initial.intialize_schedule_data', 'initialize_schedule_data'),
+    ('game_data', 'cebl_data.initial.initialize_game_data', 'initialize_game_data'),
+]
+
+
+def initialize_data(steps=None):
+    """
+    Runs all the initialize functions sequentially. Each completed step is checkpointed
+    under CHECKPOINT_DIR, so if the run is interrupted, running it again continues from
+    the first step that did not complete. The run report is written at the end, also
+    when the run fails.
+
+    Parameters
+    ----------
+    steps : list of str, optional
+        The names of the INITIALIZE_STEPS to run, e.g. ['schedule']. All steps by
+        default. The checkpoints are only cleared once every step has completed.
+
+    Returns
+    -------
+    None
+    """
+    completed = completed_steps(INITIALIZE_CHECKPOINTS)
+    try:
+        for step, module, function in INITIALIZE_STEPS:
+            if steps is not None and step not in steps:
+                continue
+            if step in completed:
+                print(f'Skipping {step}, already completed')
+                continue
+            with stage(function):
+                getattr(importlib.import_module(module), function)()
+            mark_step_completed(INITIALIZE_CHECKPOINTS, step)
+            completed.add(step)
+    finally:
+        write_run_report()
+    if all(step in completed for step, _, _ in INITIALIZE_STEPS):
+        clear_checkpoints(INITIALIZE_CHECKPOINTS)
+
+
+if __name__ == '__main__':
+    initialize_data()
@@ -0,0 +1,175 @@
+import pandas as pd
+import requests
+import re
+import json
+import os
+
+from cebl_data.utils.extract_schedule_data import extract_cebl_schedule
+from cebl_data.utils.helpers import write_csv, concat_frames
+from cebl_data.utils.upload_to_releases import upload_to_releases, upload_all_to_releases
+from cebl_data.utils.ingest_game_data import GAME_DATASETS, BACKFILL_WORKERS, ingest_game_data
+from cebl_data.utils.dataset_schemas import read_dataset_csv
+from cebl_data.utils.release_assets import SCHEDULE_URL
+from cebl_data.utils.run_report import count_rows
+from cebl_data.utils.parquet_data import write_parquet_seasons
+from cebl_data.utils.game_manifest import MANIFEST_FILE_NAME, MANIFEST_TAG, load_manifest, save_manifest, record_games
+from cebl_data.utils.checkpoints import (checkpoint_path, completed_steps, mark_step_completed, save_checkpoint_frame,
+                                         load_checkpoint_frame, clear_checkpoints)
+
+# Checkpoint scope of initialize_game_data
+GAME_DATA_CHECKPOINTS = 'game_data'
+
+
+def initialize_game_data(datasets=None):
+    """
+    Initializes and stores the game datasets from all games in the schedule. Each game
+    is downloaded once and passed to the extractor of every dataset, with games
+    extracted in BACKFILL_WORKERS processes; games in the 2019 JSON format go to the
+    2019 extractors in the same pass. Play by play data is seperated by year,
+    and every dataset is also written as one Parquet file per season.
+    The games of each dataset are recorded in the manifest used by the daily update.
+
+    Games are processed season by season. Datasets published as one file per season,
+    like the play by play, are cleaned, written and uploaded as soon as their season is
+    ingested, so their memory use is bounded by one season. The other datasets are
+    collected over every season and published at the end.
+
+    The backfill is checkpointed under CHECKPOINT_DIR: the extracted data of every
+    season is saved once the season is ingested, and each dataset (or season of a
+    per-season dataset) is marked once it is published, so a restarted run skips the
+    seasons and datasets that were already done. The checkpoints are removed when the
+    backfill finishes.
+
+    Parameters
+    ----------
+    datasets : list of str, optional
+        Keys of GAME_DATASETS to initialize. Defaults to every game dataset.
+
+    Returns
+    -------
+    None
+    """
+    if datasets is None:
+        datasets = list(GAME_DATASETS)
+
+    published = completed_steps(GAME_DATA_CHECKPOINTS)
+    manifest_checkpoint = checkpoint_path(GAME_DATA_CHECKPOINTS, MANIFEST_FILE_NAME)
+    if os.path.exists(manifest_checkpoint):
+        with open(manifest_checkpoint) as f:
+            manifest = json.load(f)
+    else:
+        manifest = load_manifest()
+        # The rebuilt datasets replace everything the manifest recorded for them
+        for dataset in datasets:
+            manifest['datasets'][dataset] = {}
+
+    per_season = [dataset for dataset in datasets if '{season}' in GAME_DATASETS[dataset]['file_name']]
+    combined = [dataset for dataset in datasets if dataset not in per_season and f'publish_{dataset}' not in published]
+    raw_frames = {dataset: [] for dataset in combined}
+
+    schedule = read_dataset_csv(SCHEDULE_URL, 'schedule')
+    for season, season_schedule in schedule.groupby('season'):
+        season_steps = {dataset: f'publish_{dataset}_{season}' for dataset in per_season}
+        pending = [dataset for dataset in per_season if season_steps[dataset] not in published]
+        if not pending and not combined:
+            print(f'Skipping season {season}, already published')
+            continue
+        season_data = _season_data(season, season_schedule, pending + combined)
+
+        for dataset in pending:
+            raw_data = season_data.pop(dataset)
+            if raw_data.empty:
+                print(f'No {dataset} data for season {season}')
+            else:
+                spec = GAME_DATASETS[dataset]
+                data = spec['clean'](raw_data)
+                file_names = write_csv(data, spec['file_name'].format(season=season))
+                _publish_dataset(dataset, data, file_names, manifest, manifest_checkpoint)
+            mark_step_completed(GAME_DATA_CHECKPOINTS, season_steps[dataset])
+        for dataset in combined:
+            raw_frames[dataset].append(season_data.pop(dataset))
+
+    for dataset in combined:
+        spec = GAME_DATASETS[dataset]
+        data = spec['clean'](concat_frames(raw_frames.pop(dataset)))
+        _publish_dataset(dataset, data, write_csv(data, spec['file_name']), manifest, manifest_checkpoint)
+        mark_step_completed(GAME_DATA_CHECKPOINTS, f'publish_{dataset}')
+
+    upload_to_releases(save_manifest(manifest), MANIFEST_TAG)
+    clear_checkpoints(GAME_DATA_CHECKPOINTS)
+
+
+def _season_data(season, season_schedule, datasets):
+    season_data = {dataset: load_checkpoint_frame(GAME_DATA_CHECKPOINTS, f'{dataset}_{season}') for dataset in datasets}
+    if all(df is not None for df in season_data.values()):
+        print(f'Resuming from the checkpoint of season {season}')
+        return season_data
+    season_data = ingest_game_data(season_schedule, datasets, workers=BACKFILL_WORKERS)
+    for dataset in datasets:
+        save_checkpoint_frame(GAME_DATA_CHECKPOINTS, f'{dataset}_{season}', season_data[dataset])
+    return season_data
+
+
+def _publish_dataset(dataset, data, file_names, manifest, manifest_checkpoint):
+    spec = GAME_DATASETS[dataset]
+    count_rows(dataset, len(data))
+    file_names = file_names + write_parquet_seasons(data, dataset, spec['parquet_file_name'])
+    upload_all_to_releases([(file_name, spec['tag']) for file_name in file_names])
+    for season, game_ids in data.groupby('season')['game_id'].unique().items():
+        record_games(manifest, dataset, game_ids, season)
+    save_manifest(manifest, manifest_checkpoint)
+
+
+def initialize_player_data():
+    """
+    Initializes and stores player boxscore data from all games in the schedule.
+
+    Returns
+    -------
+    None
+    """
+    initialize_game_data(['players'])
+
+
+def initialize_team_data():
+    """
+    Initializes and stores team boxscore data from all games in the schedule.
+
+    Returns
+    -------
+    None
+    """
+    initialize_game_data(['teams'])
+
+
+def initialize_coach_data():
+    """
+    Initializes and stores coaches data from all games in the schedule.
+
+    Returns
+    -------
+    None
+    """
+    initialize_game_data(['coaches'])
+
+
+def initialize_officials_data():
+    """
+    Initializes and stores officials data from all games in the schedule.
+
+    Returns
+    -------
+    None
+    """
+    initialize_game_data(['officials'])
+
+
+def initialize_pbp_data():
+    """
+    Initializes and stores play by play data from all games in the schedule seperated by year.
+
+    Returns
+    -------
+    None
+    """
+    initialize_game_data(['pbp'])
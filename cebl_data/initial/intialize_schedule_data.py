@@ -0,0 +1,28 @@
+import pandas as pd
+import requests
+import re
+from datetime import datetime
+
+from cebl_data.utils.extract_schedule_data import extract_cebl_schedule
+from cebl_data.utils.helpers import clean_schedule_data, write_csv, concat_frames
+from cebl_data.utils.upload_to_releases import upload_to_releases, upload_all_to_releases
+from cebl_data.utils.parquet_data import write_parquet_seasons
+from cebl_data.utils.run_report import count_rows
+
+
+def initialize_schedule_data():
+    """
+    Initialize and stores the schedule data with games from 2019 to the current year - 1,
+    as one CSV and one Parquet file per season.
+
+    Returns 
+    -------
+    None
+    """
+    year = datetime.now().year
+    schedule = concat_frames([extract_cebl_schedule(year) for year in range(2019, year)])
+    schedule = clean_schedule_data(schedule)
+    count_rows('schedule', len(schedule))
+    file_names = write_csv(schedule, 'cebl_schedule.csv')
+    file_names += write_parquet_seasons(schedule, 'schedule', 'cebl_schedule_{season}.parquet')
+    upload_all_to_releases([(file_name, 'schedule') for file_name in file_names])
\ No newline at end of file
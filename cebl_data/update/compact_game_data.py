@@ -0,0 +1,84 @@
+import pandas as pd
+import requests
+from datetime import datetime
+
+from cebl_data.utils.helpers import write_csv, concat_frames
+from cebl_data.utils.upload_to_releases import upload_all_to_releases, list_release_assets, delete_from_releases
+from cebl_data.utils.ingest_game_data import GAME_DATASETS, release_url
+from cebl_data.utils.dataset_schemas import read_dataset_csv
+from cebl_data.utils.parquet_data import write_parquet
+from cebl_data.utils.delta_partitions import season_partitions, read_partitions, merge_partitions
+from cebl_data.utils.run_report import write_run_report
+
+
+def compact_game_data(datasets=None, season=None):
+    """
+    Merges the delta partitions written by update_game_data into the season's Parquet
+    file and the dataset's CSV, then deletes the deltas. Games in a delta replace any
+    rows already published for them.
+
+    Parameters
+    ----------
+    datasets : list of str, optional
+        Keys of GAME_DATASETS to compact. Defaults to every game dataset.
+    season : int, optional
+        The season to compact. Defaults to the current year.
+
+    Returns
+    -------
+    None
+    """
+    if datasets is None:
+        datasets = list(GAME_DATASETS)
+    if season is None:
+        season = datetime.now().year
+
+    for dataset in datasets:
+        spec = GAME_DATASETS[dataset]
+        season_file_name, deltas = season_partitions(dataset, season, list_release_assets(spec['tag']))
+        if not deltas:
+            continue
+
+        published = _read_published(dataset, season)
+        new_data = merge_partitions(read_partitions(dataset, deltas))
+        if season_file_name is not None:
+            season_data = read_partitions(dataset, [season_file_name])[0]
+        elif published is not None:
+            season_data = published[published['season'] == season]
+        else:
+            season_data = pd.DataFrame(columns=['game_id', 'season'])
+        if published is None:
+            # Only the pbp file of a season can be missing, and it holds that one season
+            published = season_data
+        season_data = merge_partitions([season_data, new_data])
+
+        all_data = concat_frames([published[~published['game_id'].isin(new_data['game_id'])], new_data])
+        file_names = write_csv(all_data, spec['file_name'].format(season=season))
+        parquet_file_name = spec['parquet_file_name'].format(season=season)
+        write_parquet(season_data, dataset, parquet_file_name)
+        upload_all_to_releases([(file_name, spec['tag']) for file_name in file_names + [parquet_file_name]])
+
+        # Deltas are only removed once everything they hold is published elsewhere
+        delete_from_releases(deltas, spec['tag'])
+
+
+def _read_published(dataset, season):
+    # The pbp file of a season does not exist until its first compaction, so only its
+    # absence is expected; any other error stops the compaction before the published
+    # file is rewritten or a delta is deleted
+    try:
+        return read_dataset_csv(release_url(dataset, season), dataset)
+    except requests.HTTPError as e:
+        if dataset != 'pbp' or e.response is None or e.response.status_code != 404:
+            raise
+    except FileNotFoundError:
+        if dataset != 'pbp':
+            raise
+    return None
+
+
+if __name__ == '__main__':
+    try:
+        compact_game_data()
+    finally:
+        write_run_report()
@@ -0,0 +1,41 @@
+import importlib
+
+from cebl_data.utils.run_report import stage, write_run_report
+
+
+# The steps of update_data, in order: the step name, and the module and function that
+# run it. Modules are only imported when their step runs, so a schedule-only update
+# does not load the game data extractors.
+UPDATE_STEPS = [
+    ('schedule', 'cebl_data.update.update_schedule_data', 'update_schedule_data'),
+    ('game_data', 'cebl_data.update.update_game_data', 'update_game_data'),
+]
+
+
+def update_data(steps=None):
+    """
+    Runs the schedule update and then the game data update, which downloads
+    each new game once for every game dataset. The run report is written at the
+    end, also when the run fails.
+
+    Parameters
+    ----------
+    steps : list of str, optional
+        The names of the UPDATE_STEPS to run, e.g. ['schedule']. All steps by default.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        for step, module, function in UPDATE_STEPS:
+            if steps is not None and step not in steps:
+                continue
+            with stage(function):
+                getattr(importlib.import_module(module), function)()
+    finally:
+        write_run_report()
+
+
+if __name__ == '__main__':
+    update_data()
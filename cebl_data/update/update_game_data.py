@@ -0,0 +1,136 @@
+import pandas as pd
+import requests
+import re
+from datetime import datetime
+
+from cebl_data.utils.extract_schedule_data import extract_cebl_schedule
+from cebl_data.utils.upload_to_releases import upload_to_releases, upload_all_to_releases
+from cebl_data.utils.ingest_game_data import GAME_DATASETS, ingest_game_data
+from cebl_data.utils.dataset_schemas import read_dataset_csv
+from cebl_data.utils.release_assets import SCHEDULE_URL
+from cebl_data.utils.run_report import count_rows, failed_game_ids
+from cebl_data.utils.parquet_data import write_parquet
+from cebl_data.utils.delta_partitions import delta_file_name, published_game_ids
+from cebl_data.utils.game_manifest import MANIFEST_TAG, load_manifest, save_manifest, has_dataset, processed_game_ids, record_games
+
+
+def update_game_data(datasets=None):
+    """
+    Updates the game datasets with new games from the current season. Each new game
+    is downloaded once and passed to the extractor of every dataset. Only the new games
+    are published, as a delta Parquet file per dataset; compact_game_data later merges
+    the deltas into the season files and CSVs. The games already published are read
+    from the manifest, which is updated with the new games at the end of the run. Every
+    new game that did not fail is recorded for each dataset, also when it has no rows
+    for the dataset.
+
+    Parameters
+    ----------
+    datasets : list of str, optional
+        Keys of GAME_DATASETS to update. Defaults to every game dataset.
+
+    Returns
+    -------
+    None
+    """
+    if datasets is None:
+        datasets = list(GAME_DATASETS)
+
+    current_year = datetime.now().year
+    current_schedule = read_dataset_csv(SCHEDULE_URL, 'schedule')
+    current_schedule = current_schedule.query("season == @current_year")
+
+    manifest = load_manifest()
+    new_schedules = {}
+    for dataset in datasets:
+        if not has_dataset(manifest, dataset):
+            # A dataset the manifest does not track yet is seeded from its published partitions
+            record_games(manifest, dataset, published_game_ids(dataset, current_year), current_year)
+        published_ids = processed_game_ids(manifest, dataset, current_year)
+        new_schedules[dataset] = current_schedule[~current_schedule['fiba_id'].isin(published_ids)]
+
+    new_games = pd.concat(new_schedules.values()).drop_duplicates(subset='fiba_id')
+    new_data = ingest_game_data(new_games, datasets)
+
+    deltas = {}
+    processed_ids = {}
+    for dataset in datasets:
+        spec = GAME_DATASETS[dataset]
+        new_game_ids = new_schedules[dataset]['fiba_id'].astype(str)
+        # Games without rows for the dataset, such as a game with no officials listed,
+        # are done too; only the games that failed are tried again next run
+        processed_ids[dataset] = new_game_ids[~new_game_ids.isin(failed_game_ids(dataset))].tolist()
+        new_dataset = new_data[dataset]
+        if new_dataset.empty:
+            continue
+        new_dataset = new_dataset[new_dataset['game_id'].isin(new_game_ids)]
+        if new_dataset.empty:
+            continue
+        new_dataset = spec['clean'](new_dataset)
+        count_rows(dataset, len(new_dataset))
+        file_name = delta_file_name(dataset, current_year)
+        write_parquet(new_dataset, dataset, file_name)
+        deltas[dataset] = file_name
+
+    upload_all_to_releases([(file_name, GAME_DATASETS[dataset]['tag']) for dataset, file_name in deltas.items()])
+    for dataset, game_ids in processed_ids.items():
+        record_games(manifest, dataset, game_ids, current_year)
+
+    # Games whose delta was uploaded before a failure here are ingested again next run,
+    # and compaction keeps only their newest rows
+    upload_to_releases(save_manifest(manifest), MANIFEST_TAG)
+
+
+def update_pbp_data():
+    """
+    Updates the pbp data for the current year with new games from the current season.
+
+    Returns
+    -------
+    None
+    """
+    update_game_data(['pbp'])
+
+
+def update_officials_data():
+    """
+    Updates the officials data with new games from the current season.
+
+    Returns
+    -------
+    None
+    """
+    update_game_data(['officials'])
+
+
+def update_coaches_data():
+    """
+    Updates the coaches data with new games from the current season.
+
+    Returns
+    -------
+    None
+    """
+    update_game_data(['coaches'])
+
+
+def update_players_data():
+    """
+    Updates the players box score data with new games from the current season.
+
+    Returns
+    -------
+    None
+    """
+    update_game_data(['players'])
+
+
+def update_team_data():
+    """
+    Updates the team box score data with new games from the current season.
+
+    Returns
+    -------
+    None
+    """
+    update_game_data(['teams'])
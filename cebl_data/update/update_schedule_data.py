@@ -0,0 +1,36 @@
+import pandas as pd
+import requests
+import re
+from datetime import datetime
+
+from cebl_data.utils.extract_schedule_data import extract_cebl_schedule
+from cebl_data.utils.helpers import clean_schedule_data, write_csv
+from cebl_data.utils.upload_to_releases import upload_to_releases, upload_all_to_releases
+from cebl_data.utils.parquet_data import write_parquet
+from cebl_data.utils.dataset_schemas import read_dataset_csv
+from cebl_data.utils.release_assets import SCHEDULE_URL
+from cebl_data.utils.run_report import count_rows
+
+
+def update_schedule_data():
+    """
+    Updates the schedule data with new completed games for the current season, and
+    the Parquet file of the current season when games were added.
+    """
+    year = datetime.now().year
+    schedule = read_dataset_csv(SCHEDULE_URL, 'schedule')
+    current_schedule = extract_cebl_schedule(year)
+    current_schedule = current_schedule[~current_schedule['fiba_id'].isin(schedule['fiba_id'])]
+    current_schedule = current_schedule.query("status == 'COMPLETE'")
+    if not current_schedule.empty:
+        current_schedule = clean_schedule_data(current_schedule)
+    count_rows('schedule', len(current_schedule))
+
+    full_schedule = pd.concat([schedule, current_schedule], ignore_index=True)
+    full_schedule = clean_schedule_data(full_schedule)
+    file_names = write_csv(full_schedule, 'cebl_schedule.csv')
+    upload_all_to_releases([(file_name, 'schedule') for file_name in file_names])
+
+    if not current_schedule.empty:
+        write_parquet(full_schedule.query("season == @year"), 'schedule', f'cebl_schedule_{year}.parquet')
+        upload_to_releases(f'cebl_schedule_{year}.parquet', 'schedule')
\ No newline at end of file
@@ -0,0 +1,45 @@
+import os
+import threading
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    Give a temporary path to write a file to, and move it over path once the write
+    succeeded. Readers and other processes only ever see the old or the complete new
+    file, and a failed write leaves path as it was.
+
+    Parameters
+    ----------
+    path : str
+        The file to write.
+
+    Yields
+    ------
+    str
+        The temporary path, unique to this process and thread.
+    """
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        yield tmp_path
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def write_atomic(path, data):
+    """
+    Write bytes to a file through atomic_path.
+
+    Parameters
+    ----------
+    path : str
+        The file to write.
+    data : bytes
+    """
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
@@ -0,0 +1,120 @@
+import os
+import json
+import shutil
+import pandas as pd
+from cebl_data.utils.atomic_files import write_atomic, atomic_path
+
+
+# Long backfills write their progress to local disk so a restarted run continues from
+# the last completed unit. Each backfill keeps its checkpoints under its own scope,
+# e.g. .cache/checkpoints/game_data/, with a steps.json listing the completed steps
+# and a pickle for every intermediate DataFrame. A scope is cleared once its run
+# finishes, so checkpoints only ever describe an interrupted run.
+CHECKPOINT_DIR = os.getenv('CHECKPOINT_DIR', os.path.join('.cache', 'checkpoints'))
+
+
+def checkpoint_path(scope, name):
+    """
+    Build the path of a checkpoint file.
+
+    Parameters
+    ----------
+    scope : str
+        The backfill the checkpoint belongs to.
+    name : str
+        The file name within the scope.
+
+    Returns
+    -------
+    str
+    """
+    return os.path.join(CHECKPOINT_DIR, scope, name)
+
+
+def completed_steps(scope):
+    """
+    The steps of a backfill that completed in an earlier, interrupted run.
+
+    Parameters
+    ----------
+    scope : str
+        The backfill the steps belong to.
+
+    Returns
+    -------
+    set of str
+    """
+    try:
+        with open(checkpoint_path(scope, 'steps.json')) as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+
+def mark_step_completed(scope, step):
+    """
+    Record that a step of a backfill completed, so a restarted run skips it.
+
+    Parameters
+    ----------
+    scope : str
+        The backfill the step belongs to.
+    step : str
+        The step name.
+    """
+    steps = completed_steps(scope) | {step}
+    os.makedirs(os.path.join(CHECKPOINT_DIR, scope), exist_ok=True)
+    write_atomic(checkpoint_path(scope, 'steps.json'), json.dumps(sorted(steps)).encode())
+
+
+def save_checkpoint_frame(scope, name, df):
+    """
+    Save an intermediate DataFrame of a backfill. Pickle keeps the frame exactly as it
+    was, including the mixed-type object columns of raw extracted data.
+
+    Parameters
+    ----------
+    scope : str
+        The backfill the frame belongs to.
+    name : str
+        The frame name.
+    df : pd.DataFrame
+    """
+    os.makedirs(os.path.join(CHECKPOINT_DIR, scope), exist_ok=True)
+    path = checkpoint_path(scope, name + '.pkl')
+    with atomic_path(path) as tmp_path:
+        df.to_pickle(tmp_path)
+
+
+def load_checkpoint_frame(scope, name):
+    """
+    Load an intermediate DataFrame saved by save_checkpoint_frame.
+
+    Parameters
+    ----------
+    scope : str
+        The backfill the frame belongs to.
+    name : str
+        The frame name.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        The frame, or None if it was not saved.
+    """
+    path = checkpoint_path(scope, name + '.pkl')
+    if not os.path.exists(path):
+        return None
+    return pd.read_pickle(path)
+
+
+def clear_checkpoints(scope):
+    """
+    Remove every checkpoint of a backfill once it finished.
+
+    Parameters
+    ----------
+    scope : str
+        The backfill to clear.
+    """
+    shutil.rmtree(os.path.join(CHECKPOINT_DIR, scope), ignore_errors=True)
@@ -0,0 +1,142 @@
+import os
+import gzip
+import shutil
+import requests
+import pyarrow as pa
+from cebl_data.utils.release_assets import RELEASES_URL, open_release_asset
+
+
+# Every CSV is also published compressed, e.g. cebl_players.csv.gz, which is several
+# times smaller to upload and download. CSV_COMPRESSION lists the codecs to publish,
+# comma separated ('gzip', 'zstd' or both, empty for none); readers in the pipeline use
+# the first. With CSV_PLAIN=0 only the compressed copies are written.
+CSV_COMPRESSION = [compression for compression in os.getenv('CSV_COMPRESSION', 'gzip').split(',') if compression]
+CSV_PLAIN = os.getenv('CSV_PLAIN', '1') == '1'
+
+COMPRESSED_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+GZIP_LEVEL = 6
+_CHUNK_SIZE = 1 << 20
+
+
+def compressed_file_name(file_name, compression):
+    """
+    Build the name of the compressed copy of a CSV.
+
+    Parameters
+    ----------
+    file_name : str
+        The CSV file name or URL.
+    compression : str
+        'gzip' or 'zstd'.
+
+    Returns
+    -------
+    str
+    """
+    return file_name + COMPRESSED_SUFFIXES[compression]
+
+
+def compression_of(path):
+    """
+    The codec of a compressed CSV, from its suffix.
+
+    Parameters
+    ----------
+    path : str
+        A file name or URL.
+
+    Returns
+    -------
+    str or None
+        'gzip' or 'zstd', or None for a plain CSV.
+    """
+    for compression, suffix in COMPRESSED_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def compress_file(file_name, compression):
+    """
+    Write a compressed copy of a file, streaming it through the compressor so the file
+    is never held in memory. The output only depends on the content, so unchanged
+    files compress to identical assets.
+
+    Parameters
+    ----------
+    file_name : str
+        The file to compress.
+    compression : str
+        'gzip' or 'zstd'.
+
+    Returns
+    -------
+    str
+        The compressed file written.
+    """
+    output_name = compressed_file_name(file_name, compression)
+    with open(file_name, 'rb') as source:
+        if compression == 'gzip':
+            with gzip.GzipFile(output_name, 'wb', compresslevel=GZIP_LEVEL, mtime=0) as output:
+                shutil.copyfileobj(source, output, _CHUNK_SIZE)
+        elif compression == 'zstd':
+            with pa.CompressedOutputStream(output_name, 'zstd') as output:
+                shutil.copyfileobj(source, output, _CHUNK_SIZE)
+        else:
+            raise ValueError(f'unknown CSV compression {compression!r}')
+    return output_name
+
+
+def write_compressed_copies(file_name):
+    """
+    Write the CSV_COMPRESSION copies of a CSV, and remove the plain CSV when CSV_PLAIN
+    is off.
+
+    Parameters
+    ----------
+    file_name : str
+        The plain CSV.
+
+    Returns
+    -------
+    list of str
+        The files to publish.
+    """
+    file_names = [compress_file(file_name, compression) for compression in CSV_COMPRESSION]
+    if CSV_PLAIN or not file_names:
+        return [file_name] + file_names
+    os.remove(file_name)
+    return file_names
+
+
+def _decompress(source, compression):
+    if compression == 'gzip':
+        return gzip.open(source) if isinstance(source, str) else gzip.GzipFile(fileobj=source)
+    return pa.input_stream(source, compression=compression)
+
+
+def open_csv_asset(path):
+    """
+    Open a CSV for pd.read_csv. Compressed CSVs are decompressed as they are read, and a
+    plain CSV release asset is read from its compressed copy when one is published.
+
+    Parameters
+    ----------
+    path : str
+        A local path or release asset URL, of a plain or compressed CSV.
+
+    Returns
+    -------
+    file-like or str
+    """
+    compression = compression_of(path)
+    if compression is None and CSV_COMPRESSION and path.startswith(RELEASES_URL):
+        try:
+            return _decompress(open_release_asset(compressed_file_name(path, CSV_COMPRESSION[0])), CSV_COMPRESSION[0])
+        except requests.HTTPError as e:
+            # Not published compressed yet
+            if e.response.status_code != 404:
+                raise
+    source = open_release_asset(path)
+    return _decompress(source, compression) if compression else source
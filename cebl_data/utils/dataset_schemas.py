@@ -0,0 +1,379 @@
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from cebl_data.utils.csv_assets import open_csv_asset
+from cebl_data.utils.game_clock import add_time_columns
+from cebl_data.utils.run_report import count
+
+
+# Declared column types of every published dataset, covering the columns the clean_*
+# functions in helpers.py return. Strings that repeat across rows (names, teams, action
+# types, "MM:SS" clocks) are categoricals, counting stats are the smallest nullable integer
+# that holds them and flags are nullable booleans. Floats stay float64; write_csv writes
+# their whole values without a decimal point, as FIBA sends them and the CSVs always had them.
+_NAME_COLUMNS = {
+    'first_name': 'category',
+    'first_name_initial': 'category',
+    'last_name': 'category',
+    'last_name_initial': 'category',
+    'international_first_name': 'category',
+    'international_first_name_initial': 'category',
+    'international_last_name': 'category',
+    'international_last_name_initial': 'category',
+    'scoreboard_name': 'category',
+}
+
+_BOX_SCORE_COLUMNS = {
+    'field_goals_made': 'Int16',
+    'field_goals_attempted': 'Int16',
+    'field_goal_percentage': 'float64',
+    'two_point_field_goals_made': 'Int16',
+    'two_point_field_goals_attempted': 'Int16',
+    'two_point_percentage': 'float64',
+    'three_point_field_goals_made': 'Int16',
+    'three_point_field_goals_attempted': 'Int16',
+    'three_point_percentage': 'float64',
+    'free_throws_made': 'Int16',
+    'free_throws_attempted': 'Int16',
+    'free_throw_percentage': 'float64',
+    'offensive_rebounds': 'Int16',
+    'defensive_rebounds': 'Int16',
+    'rebounds': 'Int16',
+    'assists': 'Int16',
+    'turnovers': 'Int16',
+    'steals': 'Int16',
+    'blocks': 'Int16',
+    'blocks_received': 'Int16',
+    'personal_fouls': 'Int16',
+    'fouls_drawn': 'Int16',
+    'second_chance_points': 'Int16',
+    'fast_break_points': 'Int16',
+    'points_in_the_paint': 'Int16',
+}
+
+# The qualifiers of a pbp action (e.g. 'fastbreak', 'pointsinthepaint') are published in a
+# fixed set of columns, the Nth qualifier of the action in qualifier_N, so every season file
+# has the same columns whatever qualifiers its games use. An action with more qualifiers
+# gets qualifier_N columns past these, typed by DATASET_COLUMN_PREFIXES
+MAX_QUALIFIERS = 6
+QUALIFIER_COLUMNS = [f'qualifier_{i}' for i in range(MAX_QUALIFIERS)]
+
+DATASET_SCHEMAS = {
+    'schedule': {
+        'fiba_id': 'Int32',
+        'season': 'Int16',
+        'start_time_utc': 'string',
+        'status': 'category',
+        'competition': 'category',
+        'venue_name': 'category',
+        'period': 'category',
+        'home_team_id': 'category',
+        'home_team_name': 'category',
+        'home_team_score': 'Int16',
+        'home_team_logo_url': 'category',
+        'home_team_stats_url_en': 'string',
+        'home_team_stats_url_fr': 'string',
+        'away_team_id': 'category',
+        'away_team_name': 'category',
+        'away_team_score': 'Int16',
+        'away_team_logo_url': 'category',
+        'away_team_stats_url_en': 'string',
+        'away_team_stats_url_fr': 'string',
+        'stats_url_en': 'string',
+        'stats_url_fr': 'string',
+        'cebl_stats_url_en': 'string',
+        'cebl_stats_url_fr': 'string',
+        'tickets_url_en': 'string',
+        'tickets_url_fr': 'string',
+        'id': 'string',
+        'fiba_json_url': 'string',
+    },
+    'players': {
+        'game_id': 'Int32',
+        'season': 'Int16',
+        'team_name': 'category',
+        'player_number': 'category',
+        'player_name': 'category',
+        'position': 'category',
+        'minutes': 'category',
+        'seconds_played': 'Int16',
+        'points': 'Int16',
+        **_BOX_SCORE_COLUMNS,
+        'plus_minus': 'Int16',
+        'index_rating': 'float64',
+        'index_rating_2': 'float64',
+        'index_rating_3': 'float64',
+        'index_rating_4': 'float64',
+        'index_rating_5': 'float64',
+        'index_rating_6': 'float64',
+        'index_rating_7': 'float64',
+        **_NAME_COLUMNS,
+        'active': 'boolean',
+        'starter': 'boolean',
+        'captain': 'boolean',
+        'photo_t': 'category',
+        'photo_s': 'category',
+    },
+    'teams': {
+        'game_id': 'Int32',
+        'season': 'Int16',
+        'team_name': 'category',
+        'short_name': 'category',
+        'code': 'category',
+        'team_score': 'Int16',
+        'minutes': 'category',
+        'seconds_played': 'Int16',
+        **_BOX_SCORE_COLUMNS,
+        'total_fouls': 'Int16',
+        'bonus_fouls': 'Int8',
+        'points_from_turnovers': 'Int16',
+        'bench_points': 'Int16',
+        'team_index_rating': 'float64',
+        'team_index_rating_2': 'float64',
+        'team_index_rating_3': 'float64',
+        'team_index_rating_4': 'float64',
+        'team_index_rating_5': 'float64',
+        'team_index_rating_6': 'float64',
+        'team_index_rating_7': 'float64',
+        'team_fouls': 'Int16',
+        'team_turnovers': 'Int16',
+        'team_rebounds': 'Int16',
+        'team_defensive_rebounds': 'Int16',
+        'team_offensive_rebounds': 'Int16',
+        'period_1_score': 'Int16',
+        'period_2_score': 'Int16',
+        'period_3_score': 'Int16',
+        'period_4_score': 'Int16',
+        'biggest_lead': 'Int16',
+        'biggest_scoring_run': 'Int16',
+        'time_leading': 'float64',
+        'lead_changes': 'Int16',
+        'times_scores_level': 'Int16',
+        'timeouts_left': 'Int8',
+        'head_coach': 'category',
+        'assistant_coach_1': 'category',
+        'assistant_coach_2': 'category',
+        'international_team_name': 'category',
+        'international_short_name': 'category',
+        'international_code': 'category',
+        'logo': 'category',
+        'logo_t_url': 'category',
+        'logo_t_size': 'category',
+        'logo_t_height': 'Int16',
+        'logo_t_width': 'Int16',
+        'logo_t_bytes': 'Int32',
+        'logo_s_url': 'category',
+        'logo_s_size': 'category',
+        'logo_s_height': 'Int16',
+        'logo_s_width': 'Int16',
+        'logo_s_bytes': 'Int32',
+    },
+    'coaches': {
+        'game_id': 'Int32',
+        'season': 'Int16',
+        'team_name': 'category',
+        'coach_name': 'category',
+        'coach_type': 'category',
+        **_NAME_COLUMNS,
+    },
+    'officials': {
+        'game_id': 'Int32',
+        'season': 'Int16',
+        'officials_type': 'category',
+        'officials_name': 'category',
+        **_NAME_COLUMNS,
+    },
+    'pbp': {
+        'game_id': 'Int32',
+        'season': 'Int16',
+        'game_time': 'category',
+        'elapsed_game_seconds': 'Int16',
+        'home_score': 'Int16',
+        'away_score': 'Int16',
+        'home_lead': 'Int16',
+        'team_id': 'Int8',
+        'period': 'Int8',
+        'period_type': 'category',
+        'player_id': 'Int16',
+        'scoreboard_name': 'category',
+        'success': 'Int8',
+        'action_type': 'category',
+        'action_number': 'Int16',
+        'previous_action': 'Int16',
+        'sub_type': 'category',
+        'scoring': 'Int8',
+        'shirt_number': 'category',
+        'player_name': 'category',
+        'x': 'float64',
+        'y': 'float64',
+        **{column: 'category' for column in QUALIFIER_COLUMNS},
+        **_NAME_COLUMNS,
+    },
+}
+
+# Columns whose number depends on the data, typed by their name prefix. Files published
+# before the qualifier columns were fixed, and games with an action with more qualifiers
+# than them, can have other qualifier_N columns.
+DATASET_COLUMN_PREFIXES = {
+    'pbp': {'qualifier_': 'category'},
+}
+
+
+INTEGER_DTYPES = {'Int8', 'Int16', 'Int32', 'Int64'}
+NUMERIC_DTYPES = INTEGER_DTYPES | {'float64'}
+
+
+def column_dtype(dataset, column):
+    """
+    Look up the declared dtype of a column.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+    column : str
+        The column name.
+
+    Returns
+    -------
+    str
+        The pandas dtype of the column.
+    """
+    schema = DATASET_SCHEMAS[dataset]
+    if column in schema:
+        return schema[column]
+    for prefix, dtype in DATASET_COLUMN_PREFIXES.get(dataset, {}).items():
+        if column.startswith(prefix):
+            return dtype
+    raise KeyError(f"column '{column}' is not declared in the {dataset} schema")
+
+
+def apply_schema(df, dataset):
+    """
+    Cast every column of a cleaned DataFrame to its declared dtype. Numeric columns
+    that were read or extracted as strings (such as game_id or the pbp scores) are
+    parsed first, and values too large for their declared integer type raise an error
+    instead of wrapping around.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A DataFrame returned by one of the clean_* functions, or read from a release CSV.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with the declared dtypes.
+    """
+    columns = {}
+    for column in df.columns:
+        dtype = column_dtype(dataset, column)
+        values = df[column]
+        if values.dtype == dtype:
+            columns[column] = values
+            continue
+        if dtype in NUMERIC_DTYPES and not pd.api.types.is_numeric_dtype(values):
+            values = _to_number(values, dataset, column)
+        if dtype in INTEGER_DTYPES:
+            columns[column] = _to_integer(values, dtype, dataset, column)
+        else:
+            columns[column] = values.astype(dtype)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def report_invalid_values(dataset, column, invalid, reason):
+    """
+    Report values set to missing because they do not fit the declared dtype of their
+    column, counted as invalid_values_<dataset> in the run report. One bad value only
+    loses that value, not the dataset.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+    column : str
+        The column of the values.
+    invalid : int
+        The number of values set to missing.
+    reason : str
+        What is wrong with them, e.g. 'non-numeric values'.
+    """
+    if invalid:
+        print(f"Error for {dataset} column '{column}': {invalid} {reason} set to missing")
+        count(f'invalid_values_{dataset}', invalid)
+
+
+def _to_number(values, dataset, column):
+    text = values.astype('string').str.strip()
+    numbers = pd.to_numeric(text, errors='coerce')
+    invalid = numbers.isna() & text.ne('').fillna(False)
+    report_invalid_values(dataset, column, int(invalid.sum()), 'non-numeric values')
+    return numbers
+
+
+def _to_integer(values, dtype, dataset, column):
+    # astype wraps integers that do not fit, so the range is checked on the raw values
+    data = values.to_numpy(dtype='float64', na_value=np.nan)
+    mask = np.isnan(data)
+    info = np.iinfo(dtype.lower())
+    with np.errstate(invalid='ignore'):
+        out_of_range = ~mask & ((data < info.min) | (data > info.max))
+        fractional = ~mask & ~out_of_range & (data != np.trunc(data))
+    report_invalid_values(dataset, column, int(out_of_range.sum()), f'values outside the range of {dtype}')
+    report_invalid_values(dataset, column, int(fractional.sum()), 'non-integer values')
+    mask |= out_of_range | fractional
+    data[mask] = 0
+    return pd.Series(pd.arrays.IntegerArray(data.astype(dtype.lower()), mask), index=values.index)
+
+
+def read_dataset_csv(path, dataset):
+    """
+    Read a published CSV with the declared dtypes of its dataset, so string columns such
+    as shirt numbers are not parsed as numbers and nothing has to be inferred.
+    Release assets are read through the cache, so each is downloaded once per run, and
+    from their compressed copy when one is published.
+
+    Parameters
+    ----------
+    path : str
+        A local path or release asset URL, of a plain or compressed CSV.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    # Integers are parsed by the fast float parser (exact for any count or id) and
+    # narrowed by apply_schema, which checks their range
+    dtypes = {
+        column: 'float64' if dtype in INTEGER_DTYPES else dtype
+        for column, dtype in DATASET_SCHEMAS[dataset].items()
+    }
+    prefix_dtypes = set(DATASET_COLUMN_PREFIXES.get(dataset, {}).values())
+    if len(prefix_dtypes) == 1:
+        # Columns outside the schema can only be the prefixed ones, e.g. the pbp qualifier_N columns
+        prefix_dtype = prefix_dtypes.pop()
+        dtypes = defaultdict(lambda: prefix_dtype, dtypes)
+    df = pd.read_csv(open_csv_asset(path), dtype=dtypes)
+    if dataset == 'pbp':
+        df = _conform_qualifier_columns(df)
+    # Files published before the numeric time columns were added get them here
+    return apply_schema(add_time_columns(df, dataset), dataset)
+
+
+def _conform_qualifier_columns(pbp):
+    # Files published before the qualifier columns were fixed have as many as their games
+    # used; the missing QUALIFIER_COLUMNS are added empty, after the last qualifier
+    missing = [column for column in QUALIFIER_COLUMNS if column not in pbp.columns]
+    if not missing:
+        return pbp
+    pbp = pbp.assign(**{column: pd.Categorical([None] * len(pbp)) for column in missing})
+    qualifiers = QUALIFIER_COLUMNS + [
+        column for column in pbp.columns if column.startswith('qualifier_') and column not in QUALIFIER_COLUMNS
+    ]
+    others = [column for column in pbp.columns if not column.startswith('qualifier_')]
+    position = others.index('y') + 1 if 'y' in others else len(others)
+    return pbp[others[:position] + qualifiers + others[position:]]
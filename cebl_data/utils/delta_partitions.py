@@ -0,0 +1,129 @@
+import pandas as pd
+from datetime import datetime, timezone
+from cebl_data.utils.ingest_game_data import GAME_DATASETS
+from cebl_data.utils.release_assets import release_asset_url
+from cebl_data.utils.parquet_data import read_parquet
+from cebl_data.utils.upload_to_releases import list_release_assets
+from cebl_data.utils.helpers import concat_frames
+
+
+# Daily updates publish only the games they add, as small delta Parquet files next to
+# the season file, e.g. cebl_players_2025_delta_20250601T080512.parquet. Compaction
+# later merges the deltas of a season into cebl_players_2025.parquet and the CSVs.
+DELTA_MARKER = '_delta_'
+
+
+def delta_file_name(dataset, season, run_id=None):
+    """
+    Build the file name of a new delta partition.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    season : int
+        The season of the games in the delta.
+    run_id : str, optional
+        Identifies the run, defaults to the current UTC time so deltas sort in the
+        order they were written.
+
+    Returns
+    -------
+    str
+    """
+    if run_id is None:
+        run_id = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+    season_file_name = GAME_DATASETS[dataset]['parquet_file_name'].format(season=season)
+    return season_file_name.removesuffix('.parquet') + DELTA_MARKER + run_id + '.parquet'
+
+
+def season_partitions(dataset, season, asset_names):
+    """
+    Find the published Parquet partitions of a season.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    season : int
+        The season.
+    asset_names : list of str
+        The asset names of the dataset's release.
+
+    Returns
+    -------
+    tuple of (str or None, list of str)
+        The season file if it is published, and the season's delta files from oldest to newest.
+    """
+    season_file_name = GAME_DATASETS[dataset]['parquet_file_name'].format(season=season)
+    delta_prefix = season_file_name.removesuffix('.parquet') + DELTA_MARKER
+    deltas = sorted(name for name in asset_names if name.startswith(delta_prefix) and name.endswith('.parquet'))
+    return (season_file_name if season_file_name in asset_names else None), deltas
+
+
+def read_partitions(dataset, file_names, columns=None):
+    """
+    Read published Parquet partitions of a dataset.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    file_names : list of str
+        The partitions to read, from oldest to newest.
+    columns : list of str, optional
+        Only read these columns.
+
+    Returns
+    -------
+    list of pd.DataFrame
+    """
+    tag = GAME_DATASETS[dataset]['tag']
+    return [read_parquet(release_asset_url(tag, file_name), columns=columns) for file_name in file_names]
+
+
+def published_game_ids(dataset, season):
+    """
+    The games of a season in a dataset's published Parquet partitions. Only the
+    game_id column of each partition is read.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    season : int
+        The season.
+
+    Returns
+    -------
+    set of int
+        The fiba_ids of the games.
+    """
+    season_file_name, deltas = season_partitions(dataset, season, list_release_assets(GAME_DATASETS[dataset]['tag']))
+    partitions = ([season_file_name] if season_file_name else []) + deltas
+    game_ids = concat_frames(read_partitions(dataset, partitions, columns=['game_id']))
+    return set(game_ids['game_id'].astype(int)) if not game_ids.empty else set()
+
+
+def merge_partitions(frames):
+    """
+    Merge partitions from oldest to newest. When a game appears in more than one
+    partition, for example because it was corrected and ingested again, only its rows
+    from the newest partition are kept.
+
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        The partitions, each with a 'game_id' column, from oldest to newest.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    merged = pd.concat(frames, ignore_index=True)
+    partition = pd.Series(range(len(frames))).repeat([len(frame) for frame in frames]).to_numpy()
+    newest = pd.Series(partition).groupby(merged['game_id'].to_numpy()).transform('max').to_numpy()
+    return merged[partition == newest].reset_index(drop=True)
@@ -0,0 +1,678 @@
+from itertools import chain
+import numpy as np
+import pandas as pd
+import requests
+import re
+from cebl_data.utils import helpers as h
+from cebl_data.utils.run_report import count
+from cebl_data.utils.dataset_schemas import QUALIFIER_COLUMNS
+
+
+def extract_player_data(json):
+    """
+    Extract player data from game JSON.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the player data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the player data for a specific game
+    """
+    team_players = []
+    for team_num in ['1', '2']:
+        new_players = h.clean_column_names(pd.json_normalize(json['tm'][team_num]['pl'].values()))
+        new_players['team_name'] = json['tm'][team_num]['name']
+        team_players.append(new_players)
+    players = h.concat_frames(team_players)
+
+    players['game_id'] = json['game_id']
+    players['season'] = json['season']
+    return players
+
+
+# JSON formats of the FIBA game data, see game_json_format
+STANDARD_FORMAT = 'standard'
+FORMAT_2019 = '2019'
+
+# The flat keys holding the officials of a 2019 game
+OFFICIALS_2019_KEYS = ['officials_commisioner', 'officials_referee1', 'officials_referee2', 'officials_referee3']
+
+
+def game_json_format(json):
+    """
+    Tells the format of a game JSON from its structure alone, without extracting
+    anything. Games in the 2019 format have their officials as flat officials_* keys
+    instead of an 'officials' dict, and shots without an action number.
+
+    Parameters
+    ----------
+    json : dict
+        The game JSON.
+
+    Returns
+    -------
+    str
+        STANDARD_FORMAT or FORMAT_2019.
+    """
+    if isinstance(json.get('officials'), dict):
+        return STANDARD_FORMAT
+    for team_data in json.get('tm', {}).values():
+        shots = team_data.get('shot') or []
+        if shots and 'actionNumber' in shots[0]:
+            return STANDARD_FORMAT
+    return FORMAT_2019
+
+
+def extract_officials_data(json):
+    """
+    Extract officials data from game JSON.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the officials data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the officials data for a specific game
+    """
+    officials_list = []
+    for officials_type, officials_data in json['officials'].items():
+        officials_data['officials_type'] = officials_type
+        officials_list.append(officials_data)
+
+    officials = h.clean_column_names(pd.json_normalize(officials_list))
+    officials['game_id'] = json['game_id']
+    officials['season'] = json['season']
+    return officials
+
+
+def extract_officials_data_2019(json):
+    """
+    Extract officials data from a 2019 game where the JSON 
+    structure differs from the standard format used in later seasons.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the officials data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the officials data for a specific game
+    """
+    officials = []
+    for types in OFFICIALS_2019_KEYS:
+        if types not in json:
+            continue
+        game_id = json['game_id']
+        season = json['season']
+        officials_type = types.split("_")[1]
+        officials_name = json[types]
+        name_info = officials_name.strip().split()
+        first_name = name_info[0]
+        last_name_index = len(name_info) - 1
+        last_name = name_info[last_name_index]
+
+        officials.append({
+            'game_id': game_id, 'season': season, 'officials_type': officials_type, 
+            'officials_name': officials_name, 'first_name': first_name, 'last_name': last_name,
+            'scoreboard_name': first_name[0] + '. ' + last_name, 'first_name_initial': first_name[0],
+            'last_name_initial': last_name[0], 'international_first_name': first_name, 
+            'international_first_name_initial': first_name[0], 'international_last_name': last_name,
+            'international_last_name_initial': last_name[0]
+        })
+    return pd.DataFrame(officials)
+
+
+def extract_officials_data_2019_batch(games):
+    """
+    Extract officials data from a list of 2019 game JSON. Equivalent to concatenating
+    extract_officials_data_2019 for every game, with the names of all officials split
+    at once with the pandas string methods.
+
+    Parameters
+    ----------
+    games : list of dict
+        The JSON responses containing the officials data.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the officials data for every game
+    """
+    records = [
+        (json['game_id'], json['season'], key.split("_")[1], json[key])
+        for json in games for key in OFFICIALS_2019_KEYS if key in json
+    ]
+    if not records:
+        return pd.DataFrame()
+    officials = pd.DataFrame(records, columns=['game_id', 'season', 'officials_type', 'officials_name'])
+
+    name_info = officials['officials_name'].str.strip().str.split()
+    first_name = name_info.str[0]
+    last_name = name_info.str[-1]
+    if first_name.isna().any():
+        raise ValueError("an official has no name")
+    first_name_initial = first_name.str[0]
+    last_name_initial = last_name.str[0]
+
+    officials['first_name'] = first_name
+    officials['last_name'] = last_name
+    officials['scoreboard_name'] = first_name_initial + '. ' + last_name
+    officials['first_name_initial'] = first_name_initial
+    officials['last_name_initial'] = last_name_initial
+    officials['international_first_name'] = first_name
+    officials['international_first_name_initial'] = first_name_initial
+    officials['international_last_name'] = last_name
+    officials['international_last_name_initial'] = last_name_initial
+    return officials
+
+
+def extract_team_data(json):
+    """
+    Extract team data from game JSON.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the team data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the team data for a specific game
+    """
+    team_one_data = json['tm']['1']
+    team_two_data = json['tm']['2']
+
+    team_one = pd.json_normalize(team_one_data)
+    team_two = pd.json_normalize(team_two_data)
+    teams = pd.concat([team_one, team_two], ignore_index=True)
+
+    teams['game_id'] = json['game_id']
+    teams['season'] = json['season']
+    return teams
+
+
+def extract_coach_data(json):
+    """
+    Extract coach data from game JSON.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the coach data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the coach data for a specific game
+    """
+    coach_records = []
+
+    for team_num in ['1', '2']:
+        team_data = json['tm'][team_num]
+        team_name = team_data['name']
+        
+        coaches_data = [
+            ('coachDetails', 'Head Coach'),
+            ('assistcoach1Details', 'Assistant Coach'),
+            ('assistcoach2Details', 'Assistant Coach')
+        ]
+
+        for key, coach_type in coaches_data:
+            if key in team_data and team_data[key] is not None:
+                coach_record = pd.json_normalize(team_data[key])
+                coach_record['team_name'] = team_name
+                coach_record['coach_type'] = coach_type
+                coach_records.append(coach_record)
+
+    coaches = h.concat_frames(coach_records)
+    if coaches.empty:
+        return coaches
+    
+    coaches['game_id'] = json['game_id']
+    coaches['season'] = json['season']
+    return coaches
+
+
+def extract_pbp_data(json):
+    """
+    Extract play-by-play and shot data from game JSON.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the play-by-play and shot data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the play-by-play data with shot data added,
+        when applicable, for a specific game
+    """
+    return extract_pbp_data_batch([json])
+
+
+def extract_pbp_data_2019(json):
+    """
+    Extract pbp data from a 2019 game where the JSON 
+    structure differs from the standard format used in later seasons.
+
+    Parameters
+    ----------
+    json : dict
+        The JSON response containing the play-by-play and shot data.
+    
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the play-by-play data with shot data added,
+        when applicable, for a specific game
+    """
+    return extract_pbp_data_2019_batch([json])
+
+
+def _qualifier_frame(qualifiers, index=None):
+    """
+    Spreads the qualifier lists of pbp actions over the QUALIFIER_COLUMNS, with the Nth
+    qualifier of an action in qualifier_N and None where it has fewer qualifiers.
+    Actions with more qualifiers than there are columns get qualifier_N columns past
+    the fixed ones, counted as qualifier_columns_added, so no qualifier is lost.
+    """
+    # Actions without a qualifier key have none
+    qualifiers = [[] if isinstance(qualifier, float) and np.isnan(qualifier) else qualifier for qualifier in qualifiers]
+    if not all(isinstance(qualifier, list) for qualifier in qualifiers):
+        raise ValueError("qualifier is not a list")
+    lengths = np.fromiter(map(len, qualifiers), dtype=np.int64, count=len(qualifiers))
+    columns = QUALIFIER_COLUMNS
+    if lengths.size and lengths.max() > len(QUALIFIER_COLUMNS):
+        columns = [f'qualifier_{i}' for i in range(lengths.max())]
+        print(f"Adding qualifier columns past the {len(QUALIFIER_COLUMNS)} fixed ones, up to {columns[-1]}")
+        count('qualifier_columns_added', len(columns) - len(QUALIFIER_COLUMNS))
+    values = np.full((len(qualifiers), len(columns)), None, dtype=object)
+    rows = np.repeat(np.arange(len(qualifiers)), lengths)
+    positions = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    values[rows, positions] = np.fromiter(chain.from_iterable(qualifiers), dtype=object, count=lengths.sum())
+    return pd.DataFrame(values, columns=columns, index=index)
+
+
+def _flatten_record(record, prefix=''):
+    """
+    Flattens a JSON record the way pd.json_normalize does: top level values first,
+    then nested dicts with their keys joined by '.', and empty dicts dropped.
+    """
+    flat = {prefix + key: value for key, value in record.items() if not isinstance(value, dict)}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(_flatten_record(value, prefix + key + '.'))
+    return flat
+
+
+def _ordered_union(column_lists):
+    return list(dict.fromkeys(chain.from_iterable(column_lists)))
+
+
+def _has_nested_records(frame):
+    for column in frame.columns:
+        values = frame[column]
+        if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True).startswith('mixed'):
+            if any(isinstance(value, dict) for value in values):
+                return True
+    return False
+
+
+def _records_frame(units, snake_case=True):
+    """
+    Builds one DataFrame from the records of several units, with the rows and columns
+    of concatenating pd.json_normalize (and clean_names) of each unit. A unit is the
+    list of records one DataFrame is built from in the single-game extractors: a
+    team's players, one coach, a team, or a game's pbp.
+
+    Columns that are None in some units can get a different dtype than the concat,
+    e.g. float64 instead of object, so the output is equal to the single-game
+    extractors' once cleaned, which sets the dtype of every column.
+
+    Parameters
+    ----------
+    units : list of list of dict
+        The raw JSON records of each unit, in order.
+    snake_case : bool
+        Whether to translate the column names like clean_names(case_type='snake').
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, list of list of str)
+        The combined DataFrame and the column order of each unit's DataFrame.
+    """
+    unit_keys = [list(dict.fromkeys(chain.from_iterable(unit))) for unit in units]
+    records = list(chain.from_iterable(units))
+    frame = pd.DataFrame(records, columns=_ordered_union(unit_keys))
+    if _has_nested_records(frame):
+        flattened = [[_flatten_record(record) for record in unit] for unit in units]
+        return _records_frame(flattened, snake_case)
+
+    raw_columns = list(frame.columns)
+    if snake_case:
+        frame.columns = h.snake_case_names(raw_columns)
+        if frame.columns.has_duplicates:
+            raise ValueError("raw keys translate to duplicate column names")
+    names = dict(zip(raw_columns, frame.columns))
+    unit_columns = [[names[key] for key in keys] for keys in unit_keys]
+    return frame, unit_columns
+
+
+def _repeat_values(values, lengths):
+    return pd.Series(np.repeat(np.array(values), lengths))
+
+
+def _add_unit_and_game_columns(games, unit_values, snake_case=True):
+    """
+    Builds the combined DataFrame of several games whose single-game extractor
+    normalizes units, sets scalar columns on each unit, concatenates the units and
+    then sets 'game_id' and 'season' on the game.
+
+    Parameters
+    ----------
+    games : list of (dict, list of (list of dict, dict))
+        Each game's JSON and its units as records and the scalar columns set on them.
+    unit_values : list of str
+        The names of the scalar columns set on every unit.
+    snake_case : bool
+        Whether the units' columns go through clean_names(case_type='snake').
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    units = [records for _, game_units in games for records, _ in game_units]
+    frame, unit_columns = _records_frame(units, snake_case)
+    lengths = [len(records) for records in units]
+
+    game_columns = []
+    position = 0
+    for _, game_units in games:
+        columns = unit_columns[position:position + len(game_units)]
+        position += len(game_units)
+        if not any(len(records) for records, _ in game_units):
+            continue
+        columns = [
+            unit + [column for column in unit_values if column not in unit] if records
+            else list(unit_values)
+            for unit, (records, _) in zip(columns, game_units)
+        ]
+        columns = _ordered_union(columns)
+        game_columns.append(columns + [column for column in ['game_id', 'season'] if column not in columns])
+
+    added = unit_values + ['game_id', 'season']
+    if any(column in frame.columns for column in added):
+        raise ValueError("records already contain a column set by the extractor")
+    for column in unit_values:
+        frame[column] = _repeat_values([values[column] for _, game_units in games for _, values in game_units], lengths)
+    game_lengths = [sum(len(records) for records, _ in game_units) for _, game_units in games]
+    frame['game_id'] = _repeat_values([json['game_id'] for json, _ in games], game_lengths)
+    frame['season'] = _repeat_values([json['season'] for json, _ in games], game_lengths)
+    if frame.empty:
+        return pd.DataFrame()
+    return frame[_ordered_union(game_columns)]
+
+
+def extract_player_data_batch(games):
+    """
+    Extract player data from a list of game JSON. Equivalent to concatenating
+    extract_player_data for every game, but builds one DataFrame from all the
+    player records and translates column names through a cached mapping.
+
+    Parameters
+    ----------
+    games : list of dict
+        The JSON responses containing the player data.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the player data for every game
+    """
+    units = [
+        (json, [(list(json['tm'][team_num]['pl'].values()), {'team_name': json['tm'][team_num]['name']})
+                for team_num in ['1', '2']])
+        for json in games
+    ]
+    return _add_unit_and_game_columns(units, ['team_name'])
+
+
+def extract_team_data_batch(games):
+    """
+    Extract team data from a list of game JSON. Equivalent to concatenating
+    extract_team_data for every game.
+
+    Parameters
+    ----------
+    games : list of dict
+        The JSON responses containing the team data.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the team data for every game
+    """
+    units = [(json, [([json['tm'][team_num]], {}) for team_num in ['1', '2']]) for json in games]
+    return _add_unit_and_game_columns(units, [], snake_case=False)
+
+
+def extract_coach_data_batch(games):
+    """
+    Extract coach data from a list of game JSON. Equivalent to concatenating
+    extract_coach_data for every game.
+
+    Parameters
+    ----------
+    games : list of dict
+        The JSON responses containing the coach data.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the coach data for every game
+    """
+    coaches_data = [
+        ('coachDetails', 'Head Coach'),
+        ('assistcoach1Details', 'Assistant Coach'),
+        ('assistcoach2Details', 'Assistant Coach')
+    ]
+    units = []
+    for json in games:
+        game_units = []
+        for team_num in ['1', '2']:
+            team_data = json['tm'][team_num]
+            for key, coach_type in coaches_data:
+                if key in team_data and team_data[key] is not None:
+                    game_units.append(([team_data[key]], {'team_name': team_data['name'], 'coach_type': coach_type}))
+        units.append((json, game_units))
+    return _add_unit_and_game_columns(units, ['team_name', 'coach_type'], snake_case=False)
+
+
+def _shot_keys(action_numbers, games_of_rows, stride):
+    # Rows without a whole, non-negative action number get -1 and match nothing
+    numbers = pd.to_numeric(pd.Series(action_numbers), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    valid = (numbers >= 0) & (numbers == np.trunc(numbers))
+    return np.where(valid, games_of_rows * stride + np.where(valid, numbers, 0).astype(np.int64), -1)
+
+
+def _order_in_groups(groups):
+    # The position of each element among the elements of its group, in their order
+    order = np.argsort(groups, kind='stable')
+    sorted_groups = groups[order]
+    ordinals = np.empty(len(groups), dtype=np.int64)
+    ordinals[order] = np.arange(len(groups)) - np.searchsorted(sorted_groups, sorted_groups)
+    return ordinals
+
+
+def align_shots(games, pbp, pbp_game, by_order=False):
+    """
+    Finds the shot of every pbp action, for any number of games, with sorted key arrays
+    instead of DataFrame merges. Shots are matched to actions on their action number,
+    or, for the 2019 JSON format whose shots have no action number, by order: each
+    team's Nth field goal attempt in the pbp (an action_type containing 'pt') gets the
+    Nth shot of its shot list read from the end. When shots of a game share an action
+    number, the action gets the first of them and the others are counted as
+    shots_duplicate_action_number. Other shots that no action matches are counted as
+    shots_unmatched in the run report.
+
+    Parameters
+    ----------
+    games : list of dict
+        The game JSON, in the order of pbp_game.
+    pbp : pd.DataFrame
+        The actions of every game, with 'action_number', or 'tno' and 'action_type'
+        when matching by order.
+    pbp_game : np.ndarray
+        The position in games of the game of each action.
+    by_order : bool
+        Whether to match shots by order, for the 2019 format.
+
+    Returns
+    -------
+    tuple of (np.ndarray, pd.DataFrame)
+        The shot row of each pbp row (-1 when it has no shot) and the shot table.
+    """
+    units = [json['tm'][team_num]['shot'] for json in games for team_num in ['1', '2']]
+    shots, unit_columns = _records_frame(units)
+    required = ['x', 'y'] if by_order else ['action_number', 'x', 'y']
+    for i in range(len(games)):
+        columns = set(unit_columns[2 * i]) | set(unit_columns[2 * i + 1])
+        if not set(required) <= columns:
+            raise KeyError(f"{required} not in shots")
+
+    unit_lengths = np.array([len(unit) for unit in units], dtype=np.int64)
+    shot_unit = np.repeat(np.arange(len(units)), unit_lengths)
+    if by_order:
+        shot_ordinals = np.repeat(unit_lengths, unit_lengths) - 1 - _order_in_groups(shot_unit)
+        teams = pd.to_numeric(pbp['tno'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        attempts = pbp['action_type'].str.contains('pt', na=False).to_numpy() & np.isin(teams, [1, 2])
+        pbp_unit = pbp_game[attempts] * 2 + teams[attempts].astype(np.int64) - 1
+        pbp_ordinals = _order_in_groups(pbp_unit)
+        stride = max(unit_lengths.max(initial=0), pbp_ordinals.max(initial=0) + 1)
+        shot_keys = shot_unit * stride + shot_ordinals
+        pbp_keys = np.full(len(pbp), -1, dtype=np.int64)
+        pbp_keys[attempts] = pbp_unit * stride + pbp_ordinals
+    else:
+        numbers = pd.to_numeric(pd.concat([pbp['action_number'], shots['action_number']], ignore_index=True), errors='coerce')
+        stride = int(max(numbers.max(), 0)) + 1 if numbers.notna().any() else 1
+        shot_keys = _shot_keys(shots['action_number'], shot_unit // 2, stride)
+        pbp_keys = _shot_keys(pbp['action_number'], pbp_game, stride)
+
+    shot_order = np.argsort(shot_keys, kind='stable')
+    sorted_keys = shot_keys[shot_order]
+    # Shots sharing the key of an earlier shot, which searchsorted never finds
+    duplicates = np.zeros(len(shot_keys), dtype=bool)
+    duplicates[shot_order[1:]] = (sorted_keys[1:] == sorted_keys[:-1]) & (sorted_keys[1:] >= 0)
+    if duplicates.any():
+        print(f"Ignoring {int(duplicates.sum())} shots with the action_number of an earlier shot of their game")
+        count('shots_duplicate_action_number', int(duplicates.sum()))
+    positions = np.full(len(pbp_keys), -1, dtype=np.int64)
+    if len(sorted_keys):
+        found = np.minimum(np.searchsorted(sorted_keys, pbp_keys), len(sorted_keys) - 1)
+        matched = (sorted_keys[found] == pbp_keys) & (pbp_keys >= 0)
+        positions[matched] = shot_order[found[matched]]
+
+    used = np.zeros(len(shot_keys), dtype=bool)
+    used[positions[positions >= 0]] = True
+    unmatched = int((~used & ~duplicates).sum())
+    if unmatched:
+        count('shots_unmatched', unmatched)
+    return positions, shots
+
+
+def _extract_pbp(games, by_order=False):
+    units = [json['pbp'] for json in games]
+    pbp, unit_columns = _records_frame(units)
+    lengths = [len(unit) for unit in units]
+
+    required = ['scoreboard_name', 'first_name', 'family_name'] + ([] if by_order else ['qualifier'])
+    added = ['player_name', 'game_id', 'season', 'x', 'y']
+    for columns in unit_columns:
+        for column in required:
+            if column not in columns:
+                raise KeyError(column)
+        if any(column in added or column.startswith('qualifier_') for column in columns):
+            raise ValueError("pbp already contains a column set by the extractor")
+
+    # 2019 actions can come without qualifiers
+    qualifiers = pbp['qualifier'].tolist() if 'qualifier' in pbp.columns else [[]] * len(pbp)
+    qualifiers = _qualifier_frame(qualifiers, pbp.index)
+
+    game_columns = []
+    for columns in unit_columns:
+        columns = [
+            'scoreboard_name' if column == 'player' else column
+            for column in columns if column not in ('scoreboard_name', 'qualifier')
+        ]
+        columns += ['player_name', 'game_id', 'season'] + list(qualifiers.columns) + ['x', 'y']
+        game_columns.append(columns)
+    pbp = pbp.drop(columns=['scoreboard_name', 'qualifier'], errors='ignore').rename(columns={'player': 'scoreboard_name'})
+    pbp['player_name'] = pbp['first_name'] + ' ' + pbp['family_name']
+    pbp['game_id'] = _repeat_values([json['game_id'] for json in games], lengths)
+    pbp['season'] = _repeat_values([json['season'] for json in games], lengths)
+
+    pbp = pd.concat([pbp, qualifiers], axis=1)
+
+    pbp_game = np.repeat(np.arange(len(games)), lengths)
+    positions, shots = align_shots(games, pbp, pbp_game, by_order)
+    matched = positions >= 0
+    for column in ['x', 'y']:
+        values = shots[column].to_numpy()
+        if matched.all():
+            pbp[column] = values[positions]
+        else:
+            pbp[column] = np.where(matched, values[positions].astype(float), np.nan)
+
+    if pbp.empty:
+        return pd.DataFrame()
+    return pbp[_ordered_union(game_columns)]
+
+
+def extract_pbp_data_batch(games):
+    """
+    Extract play-by-play and shot data from a list of game JSON. Equivalent to
+    concatenating extract_pbp_data for every game, with all games' actions built
+    into one DataFrame and shot coordinates attached by align_shots.
+
+    Parameters
+    ----------
+    games : list of dict
+        The JSON responses containing the play-by-play and shot data.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the play-by-play data with shot data added,
+        when applicable, for every game
+    """
+    return _extract_pbp(games)
+
+
+def extract_pbp_data_2019_batch(games):
+    """
+    Extract play-by-play and shot data from a list of 2019 game JSON, whose shots
+    have no action number and are matched to the pbp by order, see align_shots.
+
+    Parameters
+    ----------
+    games : list of dict
+        The JSON responses containing the play-by-play and shot data.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the play-by-play data with shot data added,
+        when applicable, for every game
+    """
+    return _extract_pbp(games, by_order=True)
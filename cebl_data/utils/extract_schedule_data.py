@@ -1,7 +1,9 @@
 import pandas as pd
 import requests
 import re
-import helpers as h
+from cebl_data.utils import helpers as h
+from cebl_data.utils.run_report import stage, count
+from cebl_data.utils.http_client import http_get
 
 
 def extract_cebl_schedule(year):
@@ -23,7 +25,11 @@ def extract_cebl_schedule(year):
         "accept": "application/json"
     }
     schedule_url = "https://api.data.cebl.ca/games/" + str(year) + "/"
-    schedule_data = requests.get(schedule_url, headers=headers).json()
+    with stage('schedule_fetch'):
+        response = http_get(schedule_url, headers=headers)
+        response.raise_for_status()
+        count('bytes_downloaded_schedule', len(response.content))
+        schedule_data = response.json()
     schedule_df = pd.json_normalize(schedule_data)
 
     schedule_df['season'] = year
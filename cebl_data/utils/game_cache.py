@@ -0,0 +1,178 @@
+import os
+import json
+import hashlib
+from datetime import datetime, timezone
+from cebl_data.utils.atomic_files import write_atomic
+
+
+# Raw FIBA game JSON is kept on disk so reruns do not download games again.
+# Bodies are stored by content hash under objects/, and each game has a small
+# index file mapping its fiba_id to a body and the validators the server sent.
+FIBA_CACHE_DIR = os.getenv('FIBA_CACHE_DIR', os.path.join('.cache', 'fiba'))
+
+# With FIBA_OFFLINE=1 games are only read from the cache and never requested. The flag
+# only covers the FIBA game JSON: release assets such as the schedule are still
+# revalidated with GitHub (see release_assets).
+FIBA_OFFLINE = os.getenv('FIBA_OFFLINE', '0') == '1'
+
+
+class GameNotCachedError(LookupError):
+    """
+    Raised in offline mode when a game is not in the cache.
+    """
+
+
+def _index_path(game_id):
+    return os.path.join(FIBA_CACHE_DIR, 'games', str(game_id) + '.json')
+
+
+def _object_path(digest):
+    return os.path.join(FIBA_CACHE_DIR, 'objects', digest[:2], digest + '.json')
+
+
+def read_cache_entry(game_id):
+    """
+    Read the cache index entry of a game.
+
+    Parameters
+    ----------
+    game_id : int or str
+        The fiba_id of the game.
+
+    Returns
+    -------
+    dict or None
+        The entry with 'sha256', 'etag', 'last_modified' and 'fetched_at',
+        or None if the game is not cached.
+    """
+    try:
+        with open(_index_path(game_id)) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(_object_path(entry['sha256'])):
+        return None
+    return entry
+
+
+def load_cached_body(game_id):
+    """
+    Load the cached raw JSON body of a game.
+
+    Parameters
+    ----------
+    game_id : int or str
+        The fiba_id of the game.
+
+    Returns
+    -------
+    bytes or None
+        The raw game JSON, or None if the game is not cached.
+    """
+    entry = read_cache_entry(game_id)
+    if entry is None:
+        return None
+    with open(_object_path(entry['sha256']), 'rb') as f:
+        return f.read()
+
+
+def evict_game(game_id):
+    """
+    Remove a game from the cache index, for example because its body is not valid
+    JSON, so the next run downloads it again.
+
+    Parameters
+    ----------
+    game_id : int or str
+        The fiba_id of the game.
+    """
+    try:
+        os.remove(_index_path(game_id))
+    except FileNotFoundError:
+        pass
+
+
+def store_game(game_id, body, headers=None):
+    """
+    Store the raw JSON body of a game with the validators from its response.
+
+    Parameters
+    ----------
+    game_id : int or str
+        The fiba_id of the game.
+    body : bytes
+        The raw response body.
+    headers : Mapping, optional
+        The response headers, used for the ETag and Last-Modified validators.
+    """
+    headers = headers or {}
+    digest = hashlib.sha256(body).hexdigest()
+    object_path = _object_path(digest)
+    if not os.path.exists(object_path):
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        write_atomic(object_path, body)
+
+    entry = {
+        'sha256': digest,
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'fetched_at': datetime.now(timezone.utc).isoformat(),
+    }
+    os.makedirs(os.path.dirname(_index_path(game_id)), exist_ok=True)
+    write_atomic(_index_path(game_id), json.dumps(entry).encode())
+
+
+def touch_game(game_id):
+    """
+    Record that a cached game was revalidated and is unchanged.
+
+    Parameters
+    ----------
+    game_id : int or str
+        The fiba_id of the game.
+    """
+    entry = read_cache_entry(game_id)
+    if entry is not None:
+        entry['fetched_at'] = datetime.now(timezone.utc).isoformat()
+        write_atomic(_index_path(game_id), json.dumps(entry).encode())
+
+
+def revalidation_headers(entry):
+    """
+    Build the conditional request headers for a cached game.
+
+    Parameters
+    ----------
+    entry : dict or None
+        The cache index entry of the game.
+
+    Returns
+    -------
+    dict
+        If-None-Match and If-Modified-Since headers for the validators the entry has.
+    """
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def is_final_season(season):
+    """
+    Whether the games of a season can no longer change. Every season before
+    the current year is complete, so its cached games are never requested again.
+
+    Parameters
+    ----------
+    season : int
+        The season year.
+
+    Returns
+    -------
+    bool
+    """
+    return int(season) < datetime.now().year
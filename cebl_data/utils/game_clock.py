@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+
+# CEBL games follow FIBA timing: four 10 minute periods, then 5 minute overtimes
+REGULATION_PERIODS = 4
+REGULATION_PERIOD_SECONDS = 600
+OVERTIME_PERIOD_SECONDS = 300
+
+# The numeric column derived from a "MM:SS" column of each dataset, and that column.
+# The numeric column is placed right after it.
+TIME_COLUMNS = {
+    'players': ('seconds_played', 'minutes'),
+    'teams': ('seconds_played', 'minutes'),
+    'pbp': ('elapsed_game_seconds', 'game_time'),
+}
+
+
+def map_distinct(values, func):
+    """
+    Applies a function to each distinct value of a Series once instead of to every row.
+    Missing values stay missing.
+
+    Parameters
+    ----------
+    values : pd.Series
+        The values, e.g. a column that repeats a few strings over many rows.
+    func : callable
+        Called with each distinct value.
+
+    Returns
+    -------
+    pd.Series
+        The result for every row, with the index of values.
+    """
+    codes, uniques = pd.factorize(values)
+    results = np.empty(len(uniques) + 1, dtype=object)
+    results[:-1] = [func(value) for value in uniques]
+    results[-1] = None
+    # Missing values have code -1, which picks the None last
+    return pd.Series(results[codes], index=values.index)
+
+
+def clock_seconds(values):
+    """
+    Converts "MM:SS" clock strings to seconds, parsing each distinct string once.
+    Minutes can exceed 59, as in team minutes like "200:00", and tenths of a second
+    are dropped.
+
+    Parameters
+    ----------
+    values : pd.Series
+        The clock strings, as strings or a categorical.
+
+    Returns
+    -------
+    pd.Series
+        The seconds as float64, NaN where the value is missing or not a clock.
+    """
+    codes, uniques = pd.factorize(values)
+    parts = pd.Series(uniques, dtype=object).astype(str).str.extract(r'^\s*(\d+):(\d+)')
+    seconds = parts[0].astype(float).to_numpy() * 60 + parts[1].astype(float).to_numpy()
+    # Missing values have code -1, which picks the NaN appended last
+    return pd.Series(np.append(seconds, np.nan)[codes], index=values.index)
+
+
+def elapsed_game_seconds(game_time, period, period_type):
+    """
+    Converts the clock of pbp actions, the time left in their period, to the seconds of
+    game clock elapsed since the start of the game.
+
+    Parameters
+    ----------
+    game_time : pd.Series
+        The "MM:SS" time left in the period.
+    period : pd.Series
+        The period number. Overtimes can be numbered after the regulation periods or
+        from 1.
+    period_type : pd.Series
+        'REGULAR' or 'OVERTIME'.
+
+    Returns
+    -------
+    pd.Series
+        The elapsed seconds as float64, NaN where the clock or period is missing.
+    """
+    clock = clock_seconds(game_time).to_numpy()
+    period = pd.to_numeric(period, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    overtime = period_type.astype(object).eq('OVERTIME').to_numpy(dtype=bool)
+    overtime_number = np.where(period > REGULATION_PERIODS, period - REGULATION_PERIODS, period)
+    elapsed = np.where(
+        overtime,
+        REGULATION_PERIODS * REGULATION_PERIOD_SECONDS + overtime_number * OVERTIME_PERIOD_SECONDS - clock,
+        period * REGULATION_PERIOD_SECONDS - clock,
+    )
+    return pd.Series(elapsed, index=game_time.index)
+
+
+def add_time_columns(df, dataset):
+    """
+    Adds the numeric time column of a dataset (see TIME_COLUMNS) next to the "MM:SS"
+    column it is derived from, unless it is already there.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The players, teams or pbp data. Other datasets are returned unchanged.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if dataset not in TIME_COLUMNS:
+        return df
+    column, clock_column = TIME_COLUMNS[dataset]
+    if column in df.columns or clock_column not in df.columns:
+        return df
+    if dataset == 'pbp':
+        values = elapsed_game_seconds(df['game_time'], df['period'], df['period_type'])
+    else:
+        values = clock_seconds(df[clock_column])
+    columns = list(df.columns)
+    columns.insert(columns.index(clock_column) + 1, column)
+    return df.assign(**{column: values})[columns]
@@ -0,0 +1,129 @@
+import json
+import requests
+from datetime import datetime, timezone
+from cebl_data.utils import game_cache
+from cebl_data.utils.release_assets import release_asset_url, fetch_release_asset
+
+
+# The manifest records every game each dataset has published, so the daily update can
+# plan its work from one small JSON file instead of reading the published data:
+# {"datasets": {"players": {"<fiba_id>": {"season": 2025, "processed_at": "...", "sha256": "..."}}}}
+# sha256 is the hash of the game JSON the rows were extracted from, as stored in the game cache.
+MANIFEST_FILE_NAME = 'cebl_manifest.json'
+MANIFEST_TAG = 'schedule'
+
+
+def load_manifest(url=None):
+    """
+    Download the published manifest.
+
+    Parameters
+    ----------
+    url : str, optional
+        The manifest URL, defaults to the release asset.
+
+    Returns
+    -------
+    dict
+        The manifest, or an empty manifest if none is published yet.
+    """
+    if url is None:
+        url = release_asset_url(MANIFEST_TAG, MANIFEST_FILE_NAME)
+    try:
+        return json.loads(fetch_release_asset(url))
+    except requests.HTTPError as e:
+        if e.response.status_code != 404:
+            raise
+        return {'datasets': {}}
+
+
+def save_manifest(manifest, file_name=MANIFEST_FILE_NAME):
+    """
+    Write the manifest to a local file.
+
+    Parameters
+    ----------
+    manifest : dict
+        The manifest.
+    file_name : str
+        The file to write.
+
+    Returns
+    -------
+    str
+        The file written.
+    """
+    with open(file_name, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return file_name
+
+
+def has_dataset(manifest, dataset):
+    """
+    Whether the manifest tracks a dataset.
+
+    Parameters
+    ----------
+    manifest : dict
+        The manifest.
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+
+    Returns
+    -------
+    bool
+    """
+    return dataset in manifest['datasets']
+
+
+def processed_game_ids(manifest, dataset, season=None):
+    """
+    The games a dataset has already published.
+
+    Parameters
+    ----------
+    manifest : dict
+        The manifest.
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    season : int, optional
+        Only return games from this season.
+
+    Returns
+    -------
+    set of int
+        The fiba_ids of the games.
+    """
+    games = manifest['datasets'].get(dataset, {})
+    return {int(game_id) for game_id, entry in games.items() if season is None or entry['season'] == season}
+
+
+def record_games(manifest, dataset, game_ids, season):
+    """
+    Record that games were published for a dataset. The hash of each game's JSON is
+    taken from the game cache when the game is cached.
+
+    Parameters
+    ----------
+    manifest : dict
+        The manifest, updated in place.
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    game_ids : iterable of int or str
+        The fiba_ids of the games.
+    season : int
+        The season of the games.
+
+    Returns
+    -------
+    None
+    """
+    games = manifest['datasets'].setdefault(dataset, {})
+    processed_at = datetime.now(timezone.utc).isoformat()
+    for game_id in game_ids:
+        entry = game_cache.read_cache_entry(game_id)
+        games[str(game_id)] = {
+            'season': int(season),
+            'processed_at': processed_at,
+            'sha256': entry['sha256'] if entry is not None else None,
+        }
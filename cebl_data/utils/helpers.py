@@ -1,4 +1,14 @@
+import numpy as np
 import pandas as pd
+from functools import lru_cache
+from cebl_data.utils.dataset_schemas import apply_schema, column_dtype, report_invalid_values, NUMERIC_DTYPES, QUALIFIER_COLUMNS
+from cebl_data.utils.run_report import stage, timed_stage
+from cebl_data.utils.csv_assets import write_compressed_copies
+from cebl_data.utils.game_clock import map_distinct, add_time_columns
+
+
+# Raw FIBA keys already translated to the snake_case names clean_names gives them
+_SNAKE_CASE_NAMES = {}
 
 
 def normalize_time(time_str):
@@ -21,6 +31,120 @@ def normalize_time(time_str):
     return f"{hours}:{minutes:02d}"
 
 
+@lru_cache(maxsize=256)
+def _snake_case_columns(columns):
+    unseen = [column for column in dict.fromkeys(columns) if column not in _SNAKE_CASE_NAMES]
+    if unseen:
+        # Imported here, as it is slow to import and only runs on names not seen before
+        import janitor  # noqa: F401, registers DataFrame.clean_names
+        cleaned = pd.DataFrame(columns=unseen).clean_names(case_type='snake').columns
+        _SNAKE_CASE_NAMES.update(zip(unseen, cleaned))
+    return tuple(_SNAKE_CASE_NAMES[column] for column in columns)
+
+
+def snake_case_names(columns):
+    """
+    Translates column names to the names clean_names(case_type='snake') gives them.
+    Whole column sets are cached, since most games share the same keys, and names
+    seen before are reused so janitor only runs on new names.
+
+    Parameters
+    ----------
+    columns : iterable of str
+        The raw column names, e.g. 'tot_sFieldGoalsMade'.
+
+    Returns
+    -------
+    list of str
+        The snake_case names, e.g. 'tot_s_field_goals_made'.
+    """
+    return list(_snake_case_columns(tuple(columns)))
+
+
+def clean_column_names(df):
+    """
+    Renames the columns of a DataFrame to snake_case, giving the same names as
+    df.clean_names(case_type='snake') through the cache in snake_case_names.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame with raw column names.
+
+    Returns
+    -------
+    pd.DataFrame
+        A shallow copy of the DataFrame with snake_case column names.
+    """
+    df = df.copy(deep=False)
+    df.columns = snake_case_names(df.columns)
+    return df
+
+
+def concat_frames(frames):
+    """
+    Concatenates a list of DataFrames in a single pass. Building a dataset this way
+    instead of concatenating inside a loop copies each row once rather than once
+    per game.
+
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        The per-game (or per-record) DataFrames, in order.
+
+    Returns
+    -------
+    pd.DataFrame
+        The concatenated DataFrame with a fresh index, or an empty DataFrame if
+        there are no non-empty frames.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_csv(df, file_name):
+    """
+    Write a dataset to a CSV file and its compressed copies (see csv_assets), timed
+    as the csv_write stage of the run report.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataset.
+    file_name : str
+        The CSV file to write.
+
+    Returns
+    -------
+    list of str
+        The files written, to publish together.
+    """
+    with stage('csv_write', profile=True):
+        _whole_numbers(df).to_csv(file_name, index=False)
+        return write_compressed_copies(file_name)
+
+
+def _whole_numbers(df):
+    # FIBA sends whole numbers as integers, which the CSVs have always written as "50"
+    # rather than the "50.0" of a float64 column; other values are written unchanged
+    columns = {}
+    for column in df.columns:
+        if df[column].dtype != 'float64':
+            continue
+        values = df[column].to_numpy()
+        with np.errstate(invalid='ignore'):
+            whole = np.isfinite(values) & (values == np.trunc(values))
+        if not whole.any():
+            continue
+        text = values.astype(object)
+        text[whole] = values[whole].astype(np.int64).astype(object)
+        columns[column] = pd.Series(text, index=df.index)
+    return df.assign(**columns) if columns else df
+
+
+@timed_stage(profile=True)
 def clean_schedule_data(schedule):
     """
     Clean a schedule DataFrame by rearranging the column order.
@@ -33,7 +157,8 @@ def clean_schedule_data(schedule):
     Returns
     -------
     pd.DataFrame
-        A cleaned DataFrame of schedule with reordered columns.
+        A cleaned DataFrame of schedule with reordered columns, cast to the
+        dtypes declared in dataset_schemas.
     """
     columns = [
         'fiba_id', 'season', 'start_time_utc', 'status', 'competition', 'venue_name', 'period', 'home_team_id',
@@ -42,9 +167,10 @@ def clean_schedule_data(schedule):
         'away_team_stats_url_en', 'away_team_stats_url_fr', 'stats_url_en', 'stats_url_fr', 
         'cebl_stats_url_en', 'cebl_stats_url_fr', 'tickets_url_en', 'tickets_url_fr', 'id', 'fiba_json_url'
     ]
-    return schedule[columns]
+    return apply_schema(schedule[columns], 'schedule')
 
 
+@timed_stage(profile=True)
 def clean_player_data(players):
     """
     Clean a player DataFrame by renaming, rearranging, and creating new columns.
@@ -59,7 +185,8 @@ def clean_player_data(players):
     pd.DataFrame
         A cleaned player dataframe with standardized column names and structure.
         The player's name was added and column data was changed from na and 1.0
-        to true and false.
+        to true and false. The minutes are also given in seconds_played. Columns are cast
+        to the dtypes declared in dataset_schemas.
     """
     column_mapping = {
         's_minutes': 'minutes',
@@ -124,9 +251,10 @@ def clean_player_data(players):
         'last_name_initial', 'international_first_name', 'international_first_name_initial', 'international_last_name',
         'international_last_name_initial', 'scoreboard_name', 'active', 'starter', 'captain', 'photo_t', 'photo_s'
     ]
-    return players[columns]
+    return apply_schema(add_time_columns(players[columns], 'players'), 'players')
 
 
+@timed_stage(profile=True)
 def clean_officials_data(officials):
     """
     Clean a officials DataFrame by renaming specific columns, stripping whitespace,
@@ -142,7 +270,7 @@ def clean_officials_data(officials):
     pd.DataFrame
         A cleaned DataFrame of officials with standardized column names and structure.
         Rows with empty 'officials_name' are excluded, and all string columns are stripped
-        of leading/trailing whitespace.
+        of leading/trailing whitespace. Columns are cast to the dtypes declared in dataset_schemas.
     """
     column_mapping = {
         'family_name': 'last_name',
@@ -151,6 +279,12 @@ def clean_officials_data(officials):
         'international_family_name': 'international_last_name',
         'international_family_name_initial': 'international_last_name_initial',
     }
+    # Officials of 2019 games are extracted under the cleaned names already
+    both = [column for column, name in column_mapping.items() if column in officials and name in officials]
+    if both:
+        officials = officials.assign(**{
+            column_mapping[column]: officials[column_mapping[column]].fillna(officials[column]) for column in both
+        }).drop(columns=both)
     officials = officials.rename(columns=column_mapping)
 
     columns = [
@@ -161,9 +295,10 @@ def clean_officials_data(officials):
     ]
     officials = officials.apply(lambda col: col.str.strip() if col.dtype == "object" else col)
     officials = officials.query("officials_name != ''")
-    return officials[columns]
+    return apply_schema(officials[columns], 'officials')
 
 
+@timed_stage(profile=True)
 def clean_team_data(teams):
     """
     Cleans and standardizes a basketball team DataFrame by ensuring required columns exist,
@@ -178,9 +313,10 @@ def clean_team_data(teams):
     -------
     pd.DataFrame
         A cleaned DataFrame with standardized column names, complete structure, and
-        normalized time and lead values.
+        normalized time and lead values, with the minutes also given in seconds_played,
+        cast to the dtypes declared in dataset_schemas.
     """
-    teams = teams.clean_names(case_type="snake")
+    teams = clean_column_names(teams)
 
     columns = [
         'game_id', 'season', 'name', 'short_name', 'code', 'score', 'tot_s_minutes', 'tot_s_field_goals_made', 'tot_s_field_goals_attempted',
@@ -267,12 +403,13 @@ def clean_team_data(teams):
         'timeouts': 'timeouts_left',
     }
     teams = teams.rename(columns=column_mapping)
-    teams['minutes'] = teams['minutes'].apply(normalize_time)
+    teams['minutes'] = map_distinct(teams['minutes'], normalize_time)
     teams['biggest_lead'] = teams['biggest_lead'].fillna(0)
 
-    return teams
+    return apply_schema(add_time_columns(teams, 'teams'), 'teams')
 
 
+@timed_stage(profile=True)
 def clean_coach_data(coaches):
     """
     Cleans a basketball coach DataFrame by standardizing column names, creating
@@ -286,9 +423,10 @@ def clean_coach_data(coaches):
     Returns
     -------
     pd.DataFrame
-        A cleaned DataFrame including full coach names, renamed fields, and ordered columns.
+        A cleaned DataFrame including full coach names, renamed fields, and ordered columns,
+        cast to the dtypes declared in dataset_schemas.
     """
-    coaches = coaches.clean_names(case_type='snake')
+    coaches = clean_column_names(coaches)
 
     column_mapping = {
         'family_name': 'last_name',
@@ -306,13 +444,14 @@ def clean_coach_data(coaches):
         'international_last_name', 'international_last_name_initial',
         'scoreboard_name',
     ]
-    return coaches[columns]
+    return apply_schema(coaches[columns], 'coaches')
 
 
+@timed_stage(profile=True)
 def clean_pbp_data(pbp):
     """
     Cleans a basketball play-by-play DataFrame by replacing empty values,
-    renaming columns, and reordering with all known qualifiers.
+    renaming columns, and reordering with the fixed qualifier columns.
 
     Parameters
     ----------
@@ -322,9 +461,9 @@ def clean_pbp_data(pbp):
     Returns
     -------
     pd.DataFrame
-        A cleaned DataFrame with renamed fields, structured column order, and NA-consistent entries.
+        A cleaned DataFrame with renamed fields, structured column order, NA-consistent entries
+        and the game clock given as elapsed_game_seconds, cast to the dtypes declared in dataset_schemas.
     """
-    pbp = pbp.fillna(pd.NA).replace({None: pd.NA, "": pd.NA})
     
     column_mapping = {
         'gt': 'game_time',
@@ -349,12 +488,64 @@ def clean_pbp_data(pbp):
         'action_type', 'action_number', 'previous_action', 'sub_type', 'scoring',
         'shirt_number', 'player_name', 'first_name', 'last_name', 'x', 'y',
     ]
-    qualifier_columns = [col for col in pbp.columns if col.startswith('qualifier_')]
-
     column_end = [
         'international_first_name', 'international_last_name', 'first_name_initial', 'last_name_initial', 
         'international_first_name_initial', 'international_last_name_initial'
     ]
-    columns = column_start + qualifier_columns + column_end
-    
-    return pbp[columns]
\ No newline at end of file
+    # Actions with more qualifiers than the fixed columns have extra ones after them
+    extra_qualifiers = [
+        column for column in pbp.columns if column.startswith('qualifier_') and column not in QUALIFIER_COLUMNS
+    ]
+    columns = column_start + QUALIFIER_COLUMNS + extra_qualifiers + column_end
+    for column in QUALIFIER_COLUMNS:
+        if column not in pbp.columns:
+            pbp[column] = None
+    pbp = pbp[columns]
+
+    pbp = normalize_text_columns(pbp, 'pbp')
+    return apply_schema(add_time_columns(pbp, 'pbp'), 'pbp')
+
+
+def normalize_text_columns(df, dataset):
+    """
+    Replaces empty strings in the text columns of a DataFrame with missing values, and
+    converts the columns declared as categories or numbers. Each column is worked on
+    through its distinct values, so every distinct string is compared and parsed once
+    instead of once per row.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to clean.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS that declares the columns of df.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame without empty strings, ready for apply_schema.
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if values.dtype != object:
+            continue
+        dtype = column_dtype(dataset, column)
+        if dtype == 'category':
+            values = values.astype('category')
+            if '' in values.cat.categories:
+                values = values.cat.remove_categories([''])
+        elif dtype in NUMERIC_DTYPES:
+            codes, uniques = pd.factorize(values)
+            uniques = pd.Series(uniques, dtype=object)
+            uniques = uniques.mask(uniques == '')
+            numbers = pd.to_numeric(uniques, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            invalid = np.flatnonzero(np.isnan(numbers) & uniques.notna().to_numpy())
+            if len(invalid):
+                report_invalid_values(dataset, column, int(np.isin(codes, invalid).sum()), 'non-numeric values')
+            # Missing values have code -1, which picks the NaN appended last
+            values = pd.Series(np.append(numbers, np.nan)[codes], index=values.index)
+        else:
+            values = values.mask(values == '')
+        columns[column] = values
+    return df.assign(**columns)
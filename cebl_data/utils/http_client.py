@@ -0,0 +1,82 @@
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+
+# Every request in the project goes through a pooled session, so connections to each
+# host are kept alive and reused instead of paying a TCP and TLS handshake per request.
+# Settings are overridable through the environment.
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', 30))
+HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 3))
+HTTP_BACKOFF = float(os.getenv('HTTP_BACKOFF', 1))
+
+# Connections kept open per host, at least as many as the threads downloading at once
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 16))
+
+# Responses retried by sessions with retries: rate limiting and server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _new_session(retries):
+    session = requests.Session()
+    retry = Retry(
+        total=retries, backoff_factor=HTTP_BACKOFF, status_forcelist=RETRY_STATUSES,
+        allowed_methods={'GET', 'HEAD'}, respect_retry_after_header=True, raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Every encoding urllib3 can decode here: gzip and deflate, plus br and zstd when installed
+    session.headers.update(make_headers(accept_encoding=True))
+    return session
+
+
+def get_session(retries=True):
+    """
+    Get the pooled session of this process. Sessions are not shared with forked
+    processes, whose copies of the pooled connections would be unusable.
+
+    Parameters
+    ----------
+    retries : bool
+        Whether connection errors, timeouts and RETRY_STATUSES responses are retried
+        with exponential backoff. Callers with their own retry loop, such as the
+        rate-limited FIBA downloads, use a session without retries.
+
+    Returns
+    -------
+    requests.Session
+    """
+    key = (os.getpid(), retries)
+    with _SESSIONS_LOCK:
+        if key not in _SESSIONS:
+            _SESSIONS[key] = _new_session(HTTP_RETRIES if retries else 0)
+        return _SESSIONS[key]
+
+
+def http_get(url, headers=None, timeout=HTTP_TIMEOUT, retries=True):
+    """
+    Send a GET request through the pooled session.
+
+    Parameters
+    ----------
+    url : str
+        The URL to get.
+    headers : dict, optional
+        Headers to send with the request.
+    timeout : float
+        Seconds to wait for the server to connect and to send data.
+    retries : bool
+        Whether to retry failed requests, see get_session.
+
+    Returns
+    -------
+    requests.Response
+        The response; callers check its status.
+    """
+    return get_session(retries).get(url, headers=headers, timeout=timeout)
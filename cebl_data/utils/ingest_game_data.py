@@ -0,0 +1,460 @@
+import pandas as pd
+import requests
+import re
+import os
+import json
+import time
+import threading
+import multiprocessing
+from collections import deque
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from cebl_data.utils import game_cache
+from cebl_data.utils.http_client import http_get
+from cebl_data.utils.run_report import stage, count, record_failure, snapshot_run_report, reset_run_report, merge_run_report
+from cebl_data.utils.release_assets import release_asset_url
+from cebl_data.utils.extract_game_data import STANDARD_FORMAT, FORMAT_2019, game_json_format, extract_player_data, extract_player_data_batch, extract_team_data, extract_team_data_batch, extract_pbp_data, extract_pbp_data_batch, extract_pbp_data_2019, extract_pbp_data_2019_batch, extract_officials_data, extract_officials_data_2019, extract_officials_data_2019_batch, extract_coach_data, extract_coach_data_batch
+from cebl_data.utils.helpers import clean_player_data, clean_team_data, clean_pbp_data, clean_officials_data, clean_coach_data, concat_frames
+
+
+# Download settings for fibalivestats.dcd.shared.geniussports.com, overridable through the environment
+FIBA_MAX_WORKERS = int(os.getenv('FIBA_MAX_WORKERS', 8))
+FIBA_REQUESTS_PER_SECOND = float(os.getenv('FIBA_REQUESTS_PER_SECOND', 5))
+FIBA_RETRIES = int(os.getenv('FIBA_RETRIES', 4))
+FIBA_BACKOFF = float(os.getenv('FIBA_BACKOFF', 1))
+FIBA_TIMEOUT = float(os.getenv('FIBA_TIMEOUT', 30))
+
+# Number of downloaded games handed to the batch extractors at once
+INGEST_BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', 50))
+
+# Number of processes extracting games during a full backfill
+BACKFILL_WORKERS = int(os.getenv('BACKFILL_WORKERS', os.cpu_count() or 1))
+
+# Extraction processes are forked, so they start without importing pandas again. A
+# forked child inherits every lock held by another thread at that moment (the run
+# report's, the pooled HTTP session's) as held forever, so all of them are forked
+# before ingest_game_data starts its download threads.
+EXTRACT_CONTEXT = multiprocessing.get_context('fork')
+
+
+# Every dataset built from the FIBA game JSON, with the functions used to extract
+# and clean it and the release it is published to. Each dataset is published as CSV and
+# as one Parquet file per season; the season is filled into the pbp and Parquet file names.
+# Datasets with an 'extract_batch' function are extracted from many games at once.
+# Datasets whose 2019 games have a different JSON structure list the extractors for it
+# under 'formats'; each game is sent to the extractors of its game_json_format.
+GAME_DATASETS = {
+    'pbp': {
+        'extract': extract_pbp_data,
+        'extract_batch': extract_pbp_data_batch,
+        'formats': {
+            FORMAT_2019: {'extract': extract_pbp_data_2019, 'extract_batch': extract_pbp_data_2019_batch},
+        },
+        'clean': clean_pbp_data,
+        'file_name': 'cebl_pbp_{season}.csv',
+        'parquet_file_name': 'cebl_pbp_{season}.parquet',
+        'tag': 'pbp',
+    },
+    'officials': {
+        'extract': extract_officials_data,
+        'formats': {
+            FORMAT_2019: {'extract': extract_officials_data_2019, 'extract_batch': extract_officials_data_2019_batch},
+        },
+        'clean': clean_officials_data,
+        'file_name': 'cebl_officials.csv',
+        'parquet_file_name': 'cebl_officials_{season}.parquet',
+        'tag': 'officials',
+    },
+    'coaches': {
+        'extract': extract_coach_data,
+        'extract_batch': extract_coach_data_batch,
+        'clean': clean_coach_data,
+        'file_name': 'cebl_coaches.csv',
+        'parquet_file_name': 'cebl_coaches_{season}.parquet',
+        'tag': 'coaches',
+    },
+    'players': {
+        'extract': extract_player_data,
+        'extract_batch': extract_player_data_batch,
+        'clean': clean_player_data,
+        'file_name': 'cebl_players.csv',
+        'parquet_file_name': 'cebl_players_{season}.parquet',
+        'tag': 'player-boxscore',
+    },
+    'teams': {
+        'extract': extract_team_data,
+        'extract_batch': extract_team_data_batch,
+        'clean': clean_team_data,
+        'file_name': 'cebl_teams.csv',
+        'parquet_file_name': 'cebl_teams_{season}.parquet',
+        'tag': 'team-boxscore',
+    },
+}
+
+
+def release_url(dataset, season=None, file_key='file_name'):
+    """
+    Build the download URL of a published game dataset.
+
+    Parameters
+    ----------
+    dataset : str
+        Key of the dataset in GAME_DATASETS.
+    season : int, optional
+        The season, required for files published per season (pbp and Parquet).
+    file_key : str
+        'file_name' for the CSV or 'parquet_file_name' for the season's Parquet file.
+
+    Returns
+    -------
+    str
+        The release asset URL.
+    """
+    spec = GAME_DATASETS[dataset]
+    return release_asset_url(spec['tag'], spec[file_key].format(season=season))
+
+
+class RateLimiter:
+    """
+    Spaces out requests so no more than `requests_per_second` start per second,
+    shared by every thread that calls wait().
+
+    Parameters
+    ----------
+    requests_per_second : float
+        The maximum request rate. Zero or None disables the limit.
+    """
+
+    def __init__(self, requests_per_second):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self.next_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """
+        Block until the next request is allowed to start.
+        """
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def is_retryable(error):
+    """
+    Whether a failed request is worth retrying: connection errors, timeouts,
+    rate limiting (429) and server errors (5xx) are, other HTTP errors are not.
+
+    Parameters
+    ----------
+    error : Exception
+        The error raised by the request.
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (requests.RequestException, ValueError))
+
+
+def fetch_game_json(row, timeout=FIBA_TIMEOUT, retries=FIBA_RETRIES, backoff=FIBA_BACKOFF, limiter=None, parse=True):
+    """
+    Get the FIBA JSON of a game and tag it with its game id and season.
+
+    Games are read from the on-disk cache when possible. Cached games from a
+    completed season are never requested again, other cached games are revalidated
+    with a conditional GET, and in offline mode only the cache is used. Retryable
+    download failures are retried with exponential backoff.
+
+    Parameters
+    ----------
+    row : pd.Series
+        A schedule row with 'fiba_json_url' and 'season'.
+    timeout : float
+        Seconds to wait for the server on each request.
+    retries : int
+        How many times a retryable failure is retried.
+    backoff : float
+        Seconds to wait before the first retry, doubled on every retry after.
+    limiter : RateLimiter, optional
+        Shared rate limiter to wait on before each request.
+    parse : bool
+        Whether to parse the JSON. Without parsing, the raw body is returned so it can
+        be parsed by another process with parse_game_json.
+
+    Returns
+    -------
+    dict or tuple of (str, int, bytes)
+        The game JSON with 'game_id' and 'season' keys added, or the game id, season
+        and raw body when parse is False.
+    """
+    json_url = row['fiba_json_url']
+    game_id = re.search(r'/data/(\d+)/data\.json', json_url).group(1)
+    entry = game_cache.read_cache_entry(game_id)
+
+    with stage('game_fetch'):
+        if entry is not None and (game_cache.FIBA_OFFLINE or game_cache.is_final_season(row['season'])):
+            body = game_cache.load_cached_body(game_id)
+            count('games_from_cache')
+        elif game_cache.FIBA_OFFLINE:
+            raise game_cache.GameNotCachedError(f'game {game_id} is not cached and offline mode is on')
+        else:
+            body = _download_game_body(game_id, json_url, entry, timeout, retries, backoff, limiter)
+
+    if not parse:
+        return game_id, row['season'], body
+    try:
+        return parse_game_json(game_id, row['season'], body)
+    except ValueError:
+        game_cache.evict_game(game_id)
+        raise
+
+
+def parse_game_json(game_id, season, body):
+    """
+    Parse the raw FIBA JSON of a game and tag it with its game id and season.
+
+    Parameters
+    ----------
+    game_id : str
+        The fiba_id of the game.
+    season : int
+        The season year.
+    body : bytes
+        The raw game JSON.
+
+    Returns
+    -------
+    dict
+        The game JSON with 'game_id' and 'season' keys added.
+    """
+    json_data = json.loads(body)
+    json_data['game_id'] = game_id
+    json_data['season'] = season
+    return json_data
+
+
+def _download_game_body(game_id, json_url, entry, timeout, retries, backoff, limiter):
+    headers = game_cache.revalidation_headers(entry)
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.wait()
+        try:
+            # FIBA downloads retry in this loop, so they wait on the rate limiter between attempts
+            response = http_get(json_url, headers=headers, timeout=timeout, retries=False)
+            if response.status_code == 304:
+                game_cache.touch_game(game_id)
+                count('games_revalidated')
+                return game_cache.load_cached_body(game_id)
+            response.raise_for_status()
+            game_cache.store_game(game_id, response.content, response.headers)
+            count('games_downloaded')
+            count('bytes_downloaded_fiba', len(response.content))
+            return response.content
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+
+def fetch_games(schedule, max_workers=FIBA_MAX_WORKERS, requests_per_second=FIBA_REQUESTS_PER_SECOND, **kwargs):
+    """
+    Download the FIBA JSON of every game in the schedule with a bounded thread pool
+    and a global rate limit. Games are yielded in schedule order, and only a few
+    downloads are held in memory ahead of the consumer.
+
+    Parameters
+    ----------
+    schedule : pd.DataFrame
+        The schedule rows of the games to download.
+    max_workers : int
+        The number of download threads.
+    requests_per_second : float
+        The maximum request rate across all threads.
+    **kwargs
+        Passed to fetch_game_json (timeout, retries, backoff, parse).
+
+    Yields
+    ------
+    tuple of (pd.Series, dict or tuple or None, Exception or None)
+        The schedule row, what fetch_game_json returned, and the error if the download failed.
+    """
+    limiter = RateLimiter(requests_per_second)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _, row in schedule.iterrows():
+            pending.append((row, executor.submit(fetch_game_json, row, limiter=limiter, **kwargs)))
+            if len(pending) >= 2 * max_workers:
+                yield _result(*pending.popleft())
+        while pending:
+            yield _result(*pending.popleft())
+
+
+def _result(row, future):
+    try:
+        return row, future.result(), None
+    except Exception as e:
+        return row, None, e
+
+
+def ingest_game_data(schedule, datasets, workers=1):
+    """
+    Download each game in the schedule once and pass the JSON to the extractor
+    of every requested dataset. Games are downloaded concurrently by fetch_games.
+    With more than one worker, batches of games are extracted in a process pool
+    while the download threads keep fetching; the batches are merged in schedule
+    order, so the result is the same as extracting them in this process.
+
+    Parameters
+    ----------
+    schedule : pd.DataFrame
+        The schedule rows of the games to ingest.
+    datasets : list of str
+        Keys of GAME_DATASETS to extract.
+    workers : int
+        The number of extraction processes. 1 extracts in this process.
+
+    Returns
+    -------
+    dict of str to pd.DataFrame
+        The raw (uncleaned) extracted data for each dataset.
+    """
+    frames = {dataset: [] for dataset in datasets}
+    if workers > 1:
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=EXTRACT_CONTEXT) as executor:
+            # With fork, the first task starts every worker
+            executor.submit(int).result()
+            for bodies in game_batches(schedule, parse=False):
+                pending.append(executor.submit(extract_game_frames, bodies, datasets))
+                if len(pending) >= 2 * workers:
+                    _merge_frames(frames, *pending.popleft().result())
+            while pending:
+                _merge_frames(frames, *pending.popleft().result())
+    else:
+        for games in game_batches(schedule):
+            extract_games(games, datasets, frames)
+    return {dataset: concat_frames(dataset_frames) for dataset, dataset_frames in frames.items()}
+
+
+def game_batches(schedule, parse=True):
+    """
+    Download the games of the schedule and group them into batches for extraction.
+    Games that fail to download are reported and skipped.
+
+    Parameters
+    ----------
+    schedule : pd.DataFrame
+        The schedule rows of the games to download.
+    parse : bool
+        Whether to parse the game JSON, see fetch_game_json.
+
+    Yields
+    ------
+    list of dict or list of tuple
+        Up to INGEST_BATCH_SIZE games, in schedule order.
+    """
+    batch = []
+    for row, game, error in fetch_games(schedule, parse=parse):
+        if error is not None:
+            print(f"Error for game_id {row['fiba_id']}: {error}")
+            record_failure(row['fiba_id'], error)
+            continue
+        batch.append(game)
+        if len(batch) == INGEST_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def extract_game_frames(bodies, datasets):
+    """
+    Parse a batch of raw game bodies and extract every requested dataset from them,
+    as run by each worker process of ingest_game_data. The raw bytes are much cheaper
+    to send to a process than parsed JSON, so parsing happens here too. The run report
+    of the batch is sent back with the frames.
+
+    Parameters
+    ----------
+    bodies : list of tuple of (str, int, bytes)
+        The game id, season and raw JSON of each game in the batch.
+    datasets : list of str
+        Keys of GAME_DATASETS to extract.
+
+    Returns
+    -------
+    tuple of (dict of str to list of pd.DataFrame, list of str, dict)
+        The extracted frames of each dataset, the ids of the games that are not
+        valid JSON, and the run report of the batch.
+    """
+    reset_run_report()
+    games = []
+    invalid_game_ids = []
+    for game_id, season, body in bodies:
+        try:
+            games.append(parse_game_json(game_id, season, body))
+        except ValueError as e:
+            print(f"Error for game_id {game_id}: {e}")
+            record_failure(game_id, e)
+            invalid_game_ids.append(game_id)
+    frames = {dataset: [] for dataset in datasets}
+    extract_games(games, datasets, frames)
+    return frames, invalid_game_ids, snapshot_run_report()
+
+
+def _merge_frames(frames, batch_frames, invalid_game_ids, report):
+    for dataset, dataset_frames in batch_frames.items():
+        frames[dataset].extend(dataset_frames)
+    for game_id in invalid_game_ids:
+        game_cache.evict_game(game_id)
+    merge_run_report(report)
+
+
+def extract_games(games, datasets, frames):
+    """
+    Extract every requested dataset from a batch of games. Each run of consecutive
+    games with the same game_json_format goes to the extractors of that format, so
+    2019 games are extracted in the same pass as the others. Datasets with a batch
+    extractor are built from all the games of a run at once; if that fails, or the
+    dataset has no batch extractor, each game is extracted on its own so one bad game
+    only loses that game.
+
+    Parameters
+    ----------
+    games : list of dict
+        The game JSON of the batch.
+    datasets : list of str
+        Keys of GAME_DATASETS to extract.
+    frames : dict of str to list of pd.DataFrame
+        The extracted frames of each dataset, appended to in place.
+    """
+    if not games:
+        return
+    count('games_processed', len(games))
+    for json_format, format_games in groupby(games, key=game_json_format):
+        format_games = list(format_games)
+        if json_format != STANDARD_FORMAT:
+            count(f'games_{json_format}_format', len(format_games))
+        for dataset in datasets:
+            spec = GAME_DATASETS[dataset]
+            extractors = spec.get('formats', {}).get(json_format, spec)
+            with stage('extract', profile=True):
+                if 'extract_batch' in extractors:
+                    try:
+                        frames[dataset].append(extractors['extract_batch'](format_games))
+                        continue
+                    except Exception as e:
+                        print(f"Batch extraction failed for {dataset}, extracting each game: {e}")
+                        count(f'batch_fallback_{dataset}')
+                for json_data in format_games:
+                    try:
+                        frames[dataset].append(extractors['extract'](json_data))
+                    except Exception as e:
+                        print(f"Error for game_id {json_data['game_id']} ({dataset}): {e}")
+                        record_failure(json_data['game_id'], e, dataset)
@@ -0,0 +1,107 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from cebl_data.utils.dataset_schemas import apply_schema, column_dtype
+from cebl_data.utils.release_assets import open_release_asset
+from cebl_data.utils.run_report import timed_stage
+
+
+# Arrow type of each declared pandas dtype
+ARROW_TYPES = {
+    'Int8': pa.int8(),
+    'Int16': pa.int16(),
+    'Int32': pa.int32(),
+    'Int64': pa.int64(),
+    'float64': pa.float64(),
+    'string': pa.string(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+    'boolean': pa.bool_(),
+}
+
+PARQUET_COMPRESSION = 'zstd'
+
+
+def arrow_schema(columns, dataset):
+    """
+    Build the Arrow schema of a dataset from its declared column types.
+
+    Parameters
+    ----------
+    columns : list of str
+        The columns of the DataFrame, in order.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+
+    Returns
+    -------
+    pa.Schema
+    """
+    return pa.schema([(column, ARROW_TYPES[column_dtype(dataset, column)]) for column in columns])
+
+
+@timed_stage(profile=True)
+def write_parquet(df, dataset, file_name):
+    """
+    Write a cleaned DataFrame to a Parquet file with the declared schema of its dataset.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A DataFrame returned by one of the clean_* functions.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+    file_name : str
+        The Parquet file to write.
+
+    Returns
+    -------
+    None
+    """
+    df = apply_schema(df, dataset)
+    table = pa.Table.from_pandas(df, schema=arrow_schema(list(df.columns), dataset), preserve_index=False)
+    pq.write_table(table, file_name, compression=PARQUET_COMPRESSION)
+
+
+def write_parquet_seasons(df, dataset, file_name):
+    """
+    Write a cleaned DataFrame to one Parquet file per season.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A DataFrame returned by one of the clean_* functions, with a 'season' column.
+    dataset : str
+        Key of the dataset in DATASET_SCHEMAS.
+    file_name : str
+        The file name with a '{season}' placeholder, e.g. 'cebl_players_{season}.parquet'.
+
+    Returns
+    -------
+    list of str
+        The files written, in season order.
+    """
+    file_names = []
+    for season, season_df in df.groupby('season'):
+        season_file_name = file_name.format(season=season)
+        write_parquet(season_df, dataset, season_file_name)
+        file_names.append(season_file_name)
+    return file_names
+
+
+def read_parquet(path, columns=None):
+    """
+    Read a Parquet file written by write_parquet. The declared dtypes are stored in the
+    file, so nothing is parsed or inferred. Release assets are read through the cache.
+
+    Parameters
+    ----------
+    path : str
+        A local path or release asset URL.
+    columns : list of str, optional
+        Only read these columns.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    return pd.read_parquet(open_release_asset(path), columns=columns)
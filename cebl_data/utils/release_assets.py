@@ -0,0 +1,201 @@
+import os
+import io
+import json
+import hashlib
+import shutil
+import threading
+from collections import OrderedDict
+from cebl_data.utils.run_report import stage, count
+from cebl_data.utils.http_client import http_get
+from cebl_data.utils.atomic_files import write_atomic, atomic_path
+
+
+# Release assets such as cebl_schedule.csv are read by several stages of a run. Each
+# asset is downloaded at most once per process, and a copy is kept on disk so the next
+# run only downloads it again if its ETag changed. The most recently read assets are
+# also kept in memory, up to RELEASE_MEMORY_MB, so a long backfill does not hold every
+# asset it published. Assets uploaded in this run are read back from the disk copy.
+RELEASE_CACHE_DIR = os.getenv('RELEASE_CACHE_DIR', os.path.join('.cache', 'releases'))
+RELEASE_TIMEOUT = float(os.getenv('RELEASE_TIMEOUT', 60))
+RELEASE_MEMORY_MB = float(os.getenv('RELEASE_MEMORY_MB', 16))
+
+RELEASES_URL = 'https://github.com/ryanndu/cebl-data/releases/download/'
+
+_ASSETS = OrderedDict()
+_ASSETS_BYTES = 0
+_UPLOADED = set()
+_ASSETS_LOCK = threading.Lock()
+
+
+def release_asset_url(tag, file_name):
+    """
+    Build the download URL of a release asset.
+
+    Parameters
+    ----------
+    tag : str
+        Github release tag
+    file_name : str
+        The asset name.
+
+    Returns
+    -------
+    str
+        The release asset URL.
+    """
+    return RELEASES_URL + tag + '/' + file_name
+
+
+SCHEDULE_URL = release_asset_url('schedule', 'cebl_schedule.csv')
+
+
+def _cache_paths(url):
+    key = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(RELEASE_CACHE_DIR, key + '.bin'), os.path.join(RELEASE_CACHE_DIR, key + '.json')
+
+
+def fetch_release_asset(url, timeout=RELEASE_TIMEOUT):
+    """
+    Get the content of a release asset, from memory if it was read recently, from the
+    disk cache if it was uploaded in this process, otherwise from the disk cache after
+    revalidating its ETag, or by downloading it.
+
+    Parameters
+    ----------
+    url : str
+        The release asset URL.
+    timeout : float
+        Seconds to wait for the server.
+
+    Returns
+    -------
+    bytes
+        The asset content.
+    """
+    body_path, meta_path = _cache_paths(url)
+    with _ASSETS_LOCK:
+        if url in _ASSETS:
+            _ASSETS.move_to_end(url)
+            return _ASSETS[url]
+        uploaded = url in _UPLOADED
+    if uploaded:
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        _keep_in_memory(url, body)
+        return body
+
+    headers = {}
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if os.path.exists(body_path):
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+    except (OSError, ValueError):
+        pass
+
+    with stage('release_fetch'):
+        response = http_get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        with open(body_path, 'rb') as f:
+            body = f.read()
+    else:
+        response.raise_for_status()
+        body = response.content
+        count('bytes_downloaded_releases', len(body))
+        meta = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        os.makedirs(RELEASE_CACHE_DIR, exist_ok=True)
+        write_atomic(body_path, body)
+        write_atomic(meta_path, json.dumps(meta).encode())
+
+    _keep_in_memory(url, body)
+    return body
+
+
+def _keep_in_memory(url, body):
+    global _ASSETS_BYTES
+    with _ASSETS_LOCK:
+        if url in _ASSETS:
+            _ASSETS_BYTES -= len(_ASSETS.pop(url))
+        if len(body) > RELEASE_MEMORY_MB * 1e6:
+            return
+        _ASSETS[url] = body
+        _ASSETS_BYTES += len(body)
+        while _ASSETS_BYTES > RELEASE_MEMORY_MB * 1e6:
+            _ASSETS_BYTES -= len(_ASSETS.popitem(last=False)[1])
+
+
+def remember_release_asset(tag, file_path):
+    """
+    Replace the cached copy of a release asset after it was uploaded, so later reads
+    in the same run see the new content without downloading it. The file is copied
+    to the disk cache rather than kept in memory.
+
+    Parameters
+    ----------
+    tag : str
+        Github release tag
+    file_path : str
+        The uploaded file.
+    """
+    url = release_asset_url(tag, os.path.basename(file_path))
+    body_path, meta_path = _cache_paths(url)
+    os.makedirs(RELEASE_CACHE_DIR, exist_ok=True)
+    with atomic_path(body_path) as tmp_path:
+        shutil.copyfile(file_path, tmp_path)
+    # Without an ETag the next run downloads the asset once to learn it
+    write_atomic(meta_path, json.dumps({'etag': None, 'last_modified': None}).encode())
+    forget_release_asset(tag, os.path.basename(file_path))
+    with _ASSETS_LOCK:
+        _UPLOADED.add(url)
+
+
+def forget_release_asset(tag, file_name):
+    """
+    Drop the in-memory copy of a deleted or replaced release asset.
+
+    Parameters
+    ----------
+    tag : str
+        Github release tag
+    file_name : str
+        The asset name.
+    """
+    global _ASSETS_BYTES
+    url = release_asset_url(tag, file_name)
+    with _ASSETS_LOCK:
+        _ASSETS_BYTES -= len(_ASSETS.pop(url, b''))
+        _UPLOADED.discard(url)
+
+
+def reset_release_assets():
+    """
+    Forget the assets read and uploaded in this process, e.g. before working in
+    another directory, whose disk cache the uploaded assets are not in.
+    """
+    global _ASSETS_BYTES
+    with _ASSETS_LOCK:
+        _ASSETS.clear()
+        _ASSETS_BYTES = 0
+        _UPLOADED.clear()
+
+
+def open_release_asset(path):
+    """
+    Open a release asset URL through the cache. Local paths are returned unchanged,
+    so readers such as pd.read_csv accept either.
+
+    Parameters
+    ----------
+    path : str
+        A release asset URL or a local path.
+
+    Returns
+    -------
+    io.BytesIO or str
+    """
+    if path.startswith(RELEASES_URL):
+        return io.BytesIO(fetch_release_asset(path))
+    return path
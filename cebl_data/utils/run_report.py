@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import cProfile
+import threading
+from functools import wraps
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+# Every run collects what it did into one report: the time spent in each stage, counters
+# such as bytes downloaded and games processed, rows produced per dataset and the games
+# that failed. The report is written as JSON at the end of the run. Stage times are
+# summed over calls, so stages run from several threads can add up to more than the run.
+RUN_REPORT_FILE = os.getenv('RUN_REPORT_FILE', 'run_report.json')
+
+# When set, the hot sections are profiled with cProfile and dumped here, one .prof file
+# per stage, e.g. for snakeviz or pstats. Only the main thread of the main process is profiled.
+RUN_PROFILE_DIR = os.getenv('RUN_PROFILE_DIR')
+
+_REPORT_LOCK = threading.Lock()
+_PROFILING = threading.local()
+_PROFILES = {}
+
+
+def _empty_report():
+    return {
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'stages': {},
+        'counters': {},
+        'rows': {},
+        'failures': [],
+    }
+
+
+_REPORT = _empty_report()
+
+
+@contextmanager
+def stage(name, profile=False):
+    """
+    Time a stage of the run.
+
+    Parameters
+    ----------
+    name : str
+        The stage name, e.g. 'game_fetch' or 'clean'.
+    profile : bool
+        Whether the stage is a hot section to profile when RUN_PROFILE_DIR is set.
+        Stages nested in a profiled stage are part of its profile.
+    """
+    profiler = None
+    if profile and RUN_PROFILE_DIR and not getattr(_PROFILING, 'active', False):
+        with _REPORT_LOCK:
+            profiler = _PROFILES.setdefault(name, cProfile.Profile())
+        _PROFILING.active = True
+        profiler.enable()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            _PROFILING.active = False
+        with _REPORT_LOCK:
+            totals = _REPORT['stages'].setdefault(name, {'seconds': 0.0, 'calls': 0})
+            totals['seconds'] += seconds
+            totals['calls'] += 1
+
+
+def count(name, value=1):
+    """
+    Add to a counter of the run.
+
+    Parameters
+    ----------
+    name : str
+        The counter name, e.g. 'bytes_uploaded' or 'games_processed'.
+    value : int
+        The amount to add.
+    """
+    with _REPORT_LOCK:
+        _REPORT['counters'][name] = _REPORT['counters'].get(name, 0) + value
+
+
+def count_rows(dataset, rows):
+    """
+    Add to the rows produced for a dataset.
+
+    Parameters
+    ----------
+    dataset : str
+        The dataset name.
+    rows : int
+        The number of rows.
+    """
+    with _REPORT_LOCK:
+        _REPORT['rows'][dataset] = _REPORT['rows'].get(dataset, 0) + rows
+
+
+def record_failure(game_id, error, dataset=None):
+    """
+    Record a game that failed to download, parse or extract.
+
+    Parameters
+    ----------
+    game_id : int or str
+        The fiba_id of the game.
+    error : Exception or str
+        What went wrong.
+    dataset : str, optional
+        The dataset the game failed for, or None if it failed for every dataset.
+    """
+    with _REPORT_LOCK:
+        _REPORT['failures'].append({'game_id': str(game_id), 'dataset': dataset, 'error': str(error)})
+
+
+def failed_game_ids(dataset=None):
+    """
+    The games recorded as failed so far in this run for a dataset, including the games
+    that failed for every dataset, e.g. because they could not be downloaded.
+
+    Parameters
+    ----------
+    dataset : str, optional
+        The dataset, or None for only the games that failed for every dataset.
+
+    Returns
+    -------
+    set of str
+        The fiba_ids of the games.
+    """
+    with _REPORT_LOCK:
+        return {failure['game_id'] for failure in _REPORT['failures'] if failure['dataset'] in (None, dataset)}
+
+
+def snapshot_run_report():
+    """
+    Copy the report collected so far, e.g. to send it from a worker process back to
+    the main process.
+
+    Returns
+    -------
+    dict
+    """
+    with _REPORT_LOCK:
+        return json.loads(json.dumps(_REPORT))
+
+
+def reset_run_report():
+    """
+    Start a new, empty report.
+    """
+    global _REPORT
+    with _REPORT_LOCK:
+        _REPORT = _empty_report()
+        _PROFILES.clear()
+
+
+def merge_run_report(snapshot):
+    """
+    Add a report collected elsewhere, such as in a worker process, to this one.
+
+    Parameters
+    ----------
+    snapshot : dict
+        A report returned by snapshot_run_report.
+    """
+    with _REPORT_LOCK:
+        for name, stage_totals in snapshot['stages'].items():
+            totals = _REPORT['stages'].setdefault(name, {'seconds': 0.0, 'calls': 0})
+            totals['seconds'] += stage_totals['seconds']
+            totals['calls'] += stage_totals['calls']
+        for key in ['counters', 'rows']:
+            for name, value in snapshot[key].items():
+                _REPORT[key][name] = _REPORT[key].get(name, 0) + value
+        _REPORT['failures'].extend(snapshot['failures'])
+
+
+def write_run_report(file_name=RUN_REPORT_FILE):
+    """
+    Write the report of the run as JSON, and the profile of each profiled stage to
+    RUN_PROFILE_DIR when it is set.
+
+    Parameters
+    ----------
+    file_name : str
+        The report file.
+
+    Returns
+    -------
+    str
+        The report file written.
+    """
+    report = snapshot_run_report()
+    report['finished_at'] = datetime.now(timezone.utc).isoformat()
+    with open(file_name, 'w') as f:
+        json.dump(report, f, indent=1)
+
+    if RUN_PROFILE_DIR:
+        os.makedirs(RUN_PROFILE_DIR, exist_ok=True)
+        with _REPORT_LOCK:
+            profiles = dict(_PROFILES)
+        for name, profiler in profiles.items():
+            profiler.dump_stats(os.path.join(RUN_PROFILE_DIR, name + '.prof'))
+    return file_name
+
+
+def timed_stage(profile=False):
+    """
+    Decorate a function so every call is timed as a stage named after it.
+
+    Parameters
+    ----------
+    profile : bool
+        Whether the function is a hot section to profile when RUN_PROFILE_DIR is set.
+
+    Returns
+    -------
+    callable
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(func.__name__, profile=profile):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
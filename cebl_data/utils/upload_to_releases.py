@@ -0,0 +1,207 @@
+import requests
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from io import StringIO
+import json
+from cebl_data.utils.release_assets import remember_release_asset, forget_release_asset
+from cebl_data.utils.run_report import stage, count
+
+
+# Number of assets uploaded at once by upload_all_to_releases
+UPLOAD_WORKERS = int(os.getenv('UPLOAD_WORKERS', 4))
+
+# One authenticated client per run: the repository, each release and the assets of each
+# release are only requested once, and the asset lists are kept up to date as assets are
+# uploaded and deleted.
+_GITHUB_LOCK = threading.RLock()
+_REPO = None
+_RELEASES = {}
+_RELEASE_ASSETS = {}
+
+
+def get_repo():
+    """
+    Gets the GITHUB repository the data is released from, authenticating once per run.
+
+    Returns
+    -------
+    github.Repository.Repository
+    """
+    global _REPO
+    with _GITHUB_LOCK:
+        if _REPO is None:
+            # Imported here, as PyGithub is slow to import and only needed once a file is published
+            from github import Github
+
+            load_dotenv()
+
+            token = os.getenv("GITHUB_TOKEN")
+            owner = os.getenv("GITHUB_OWNER")
+            repo = os.getenv("GITHUB_REPO")
+
+            g = Github(token)
+            repo_name = f"{owner}/{repo}"
+            _REPO = g.get_repo(repo_name)
+        return _REPO
+
+
+def get_release(tag):
+    """
+    Gets the GITHUB release specified by tag.
+
+    Parameters
+    ----------
+    tag : str
+        Github release tag
+
+    Returns
+    -------
+    github.GitRelease.GitRelease
+    """
+    with _GITHUB_LOCK:
+        if tag not in _RELEASES:
+            _RELEASES[tag] = get_repo().get_release(tag)
+        return _RELEASES[tag]
+
+
+def _release_assets(tag):
+    with _GITHUB_LOCK:
+        if tag not in _RELEASE_ASSETS:
+            _RELEASE_ASSETS[tag] = {asset.name: asset for asset in get_release(tag).get_assets()}
+        return _RELEASE_ASSETS[tag]
+
+
+def _file_sha256(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_unchanged(asset, file_path):
+    """
+    Whether a release asset already has the content of a file. Sizes are compared
+    first; when they match, the SHA-256 digest GitHub reports for the asset in the
+    asset listing is compared. Assets listed without a digest count as changed, so
+    they are uploaded again rather than requested one by one.
+
+    Parameters
+    ----------
+    asset : github.GitReleaseAsset.GitReleaseAsset
+        The published asset, as listed by the release.
+    file_path : str
+        The local file.
+
+    Returns
+    -------
+    bool
+    """
+    if asset.size != os.path.getsize(file_path):
+        return False
+    # The attributes of the listing, raw_data would request each asset again to complete them
+    asset_digest = asset._rawData.get('digest')
+    return asset_digest is not None and asset_digest == 'sha256:' + _file_sha256(file_path)
+
+
+def upload_to_releases(file_path, tag):
+    """
+    Uploads a file to a GITHUB release specified by tag, replacing the asset with the
+    same name. Nothing is uploaded when the asset already has the same content.
+
+    Parameters
+    ----------
+    file_path : str
+
+    tag : str
+        Github release tag
+
+    Returns
+    -------
+    bool
+        Whether the file was uploaded.
+    """
+    filename = os.path.basename(file_path)
+
+    with stage('upload'):
+        existing = _release_assets(tag).get(filename)
+        if existing is not None and is_unchanged(existing, file_path):
+            count('files_unchanged')
+            remember_release_asset(tag, file_path)
+            return False
+
+        if existing is not None:
+            existing.delete_asset()
+        asset = get_release(tag).upload_asset(file_path)
+        with _GITHUB_LOCK:
+            _release_assets(tag)[filename] = asset
+
+    count('files_uploaded')
+    count('bytes_uploaded', os.path.getsize(file_path))
+    remember_release_asset(tag, file_path)
+    return True
+
+
+def upload_all_to_releases(uploads, workers=UPLOAD_WORKERS):
+    """
+    Uploads several files to GITHUB releases in parallel, skipping unchanged files
+    like upload_to_releases.
+
+    Parameters
+    ----------
+    uploads : list of tuple of (str, str)
+        The file path and release tag of each upload.
+    workers : int
+        The number of uploads at once.
+
+    Returns
+    -------
+    int
+        The number of files uploaded.
+    """
+    if not uploads:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(workers, len(uploads))) as executor:
+        uploaded = list(executor.map(lambda upload: upload_to_releases(*upload), uploads))
+    return sum(uploaded)
+
+
+def list_release_assets(tag):
+    """
+    Lists the asset names of a GITHUB release specified by tag.
+
+    Parameters
+    ----------
+    tag : str
+        Github release tag
+
+    Returns
+    -------
+    list of str
+    """
+    with _GITHUB_LOCK:
+        return list(_release_assets(tag))
+
+
+def delete_from_releases(file_names, tag):
+    """
+    Deletes assets from a GITHUB release specified by tag.
+
+    Parameters
+    ----------
+    file_names : list of str
+        The asset names to delete. Names that are not in the release are ignored.
+    tag : str
+        Github release tag
+    """
+    with _GITHUB_LOCK:
+        assets = _release_assets(tag)
+        to_delete = [assets[name] for name in set(file_names) if name in assets]
+    for asset in to_delete:
+        asset.delete_asset()
+        with _GITHUB_LOCK:
+            assets.pop(asset.name, None)
+        forget_release_asset(tag, asset.name)
@@ -0,0 +1,44 @@
+import json
+import random
+import pandas as pd
+
+from synthetic_game import synthetic_games
+from cebl_data.utils.ingest_game_data import GAME_DATASETS
+from cebl_data.utils.helpers import write_csv
+
+
+def _games():
+    # Half the float stats are whole numbers, sent as integers like FIBA sends them
+    rng = random.Random(0)
+    games = synthetic_games(4)
+    for game in games:
+        for team in game['tm'].values():
+            team['tot_eff_1'] = rng.randint(0, 100)
+            team['tot_sTimeLeading'] = rng.choice([rng.randint(0, 40), rng.random() * 40])
+            team['tot_sFieldGoalsPercentage'] = rng.choice([rng.randint(0, 100), round(rng.random() * 100, 1)])
+            for player in team['pl'].values():
+                player['eff_1'] = rng.choice([rng.randint(0, 20), rng.random() * 20])
+    return games
+
+
+def _csv_text(dataset, games, tmp_path, column):
+    spec = GAME_DATASETS[dataset]
+    data = spec['clean'](pd.concat([spec['extract'](game) for game in games], ignore_index=True))
+    file_name = write_csv(data, str(tmp_path / f'{dataset}.csv'))[0]
+    return sorted(pd.read_csv(file_name, dtype=str)[column])
+
+
+def test_float_columns_are_written_like_the_json(tmp_path):
+    # The CSVs were written from the raw JSON values before the schema typed these
+    # columns as float64, so the text of every value must stay the JSON text
+    games = _games()
+    teams = [team for game in games for team in game['tm'].values()]
+    players = [player for team in teams for player in team['pl'].values()]
+    expected = {
+        ('teams', 'team_index_rating'): [team['tot_eff_1'] for team in teams],
+        ('teams', 'time_leading'): [team['tot_sTimeLeading'] for team in teams],
+        ('teams', 'field_goal_percentage'): [team['tot_sFieldGoalsPercentage'] for team in teams],
+        ('players', 'index_rating'): [player['eff_1'] for player in players],
+    }
+    for (dataset, column), values in expected.items():
+        assert _csv_text(dataset, games, tmp_path, column) == sorted(json.dumps(value) for value in values), column